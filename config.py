@@ -23,6 +23,10 @@ class Config:
     MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # Optimal for I/O bound tasks
     TASK_TIMEOUT = 30  # seconds per task
     BATCH_SIZE = 100  # files per batch
+    RESULT_CACHE_SIZE = 1024  # results kept for repeated inquiry texts (0 disables)
+    ENCODING_CACHE_SIZE = 1024  # detected encodings kept per (path, mtime, size) (0 disables)
+    ENCODING_SAMPLE_SIZE = 2048  # bytes given to the encoding detector first
+    ENCODING_MAX_SAMPLE_SIZE = 10000  # sample grows to this when confidence is low
     
     # Text processing settings
     MIN_TEXT_LENGTH = 10  # minimum characters for valid inquiry
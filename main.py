@@ -140,13 +140,14 @@ class TravelAgentApp:
         
         return results
     
-    def run(self, inquiries_dir: str = None, output_file: str = None) -> str:
+    def run(self, inquiries_dir: str = None, output_file: str = None, json_output: str = None) -> str:
         """
         Main execution method
         
         Args:
             inquiries_dir: Directory containing inquiry files (optional)
             output_file: Output Excel file path (optional)
+            json_output: Also write the raw results as JSON Lines to this path (optional)
             
         Returns:
             Path to generated Excel file
@@ -180,6 +181,9 @@ class TravelAgentApp:
             self.logger.info("Generating Excel report...")
             excel_path = self.excel_generator.generate_report(results, output_file)
             
+            if json_output:
+                self.save_results_json(results, json_output)
+            
             total_time = time.time() - start_time
             self.logger.info(f"=== Processing completed in {total_time:.2f} seconds ===")
             self.logger.info(f"Excel report generated: {excel_path}")
@@ -193,6 +197,27 @@ class TravelAgentApp:
             self.logger.error(f"Application error: {str(e)}")
             raise
     
+    def save_results_json(self, results: List[Dict[str, Any]], output_path: str) -> str:
+        """
+        Write processing results as JSON Lines, one result per line
+        
+        Args:
+            results: Processing results
+            output_path: Output .jsonl file path
+            
+        Returns:
+            Path to the written file
+        """
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        
+        # Encode every result first, then hand the file one buffer
+        data = b''.join(self.processor.serialize_result(result) + b'\n' for result in results)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        
+        self.logger.info(f"JSON results written: {output_path} ({len(results)} results)")
+        return output_path
+    
     def _create_sample_inquiries(self, inquiries_dir: str):
         """Create sample inquiry files for demonstration"""
         sample_inquiries = [
@@ -245,6 +270,9 @@ def main():
     parser.add_argument('--output-file', '-o',
                        help='Output Excel file path',
                        default=None)
+    parser.add_argument('--json-output', '-j',
+                       help='Also write raw results to this JSON Lines file',
+                       default=None)
     parser.add_argument('--verbose', '-v',
                        action='store_true',
                        help='Enable verbose logging')
@@ -254,7 +282,7 @@ def main():
     try:
         # Create and run the application
         app = TravelAgentApp()
-        excel_path = app.run(args.inquiries_dir, args.output_file)
+        excel_path = app.run(args.inquiries_dir, args.output_file, args.json_output)
         
         print(f"\n✅ Processing completed successfully!")
         print(f"📊 Excel report generated: {excel_path}")
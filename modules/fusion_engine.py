@@ -26,6 +26,16 @@ class FusionEngine:
             'COMBINED': 1.0
         }
         
+        # Confidence credited to one field by the method that resolved it; the
+        # single source for _calculate_confidence (anything else, e.g. NONE,
+        # scores 0.0). Not to be confused with method_weights above, the
+        # relative trust between the ML and rule extractors.
+        self.field_confidence_by_method = {
+            'COMBINED': 1.0,
+            'RULE_BASED': 0.8,
+            'ML_NER': 0.7
+        }
+        
         # Similarity threshold for entity matching
         self.similarity_threshold = 0.8
     
@@ -403,23 +413,12 @@ class FusionEngine:
         Returns:
             Confidence score between 0 and 1
         """
-        method_scores = []
-        
-        for method in methods:
-            if method == 'COMBINED':
-                method_scores.append(1.0)
-            elif method == 'RULE_BASED':
-                method_scores.append(0.8)
-            elif method == 'ML_NER':
-                method_scores.append(0.7)
-            else:  # NONE
-                method_scores.append(0.0)
-        
-        # Calculate weighted average
-        if method_scores:
-            return sum(method_scores) / len(method_scores)
-        else:
+        if not methods:
             return 0.0
+        
+        # Average of the per-field method confidences (table lookup, summed in order)
+        scores = self.field_confidence_by_method
+        return sum(scores.get(method, 0.0) for method in methods) / len(methods)
     
     def _create_empty_result(self) -> Dict[str, Any]:
         """
@@ -462,11 +461,11 @@ class FusionEngine:
             # Extract schema-compatible data from fused results
             schema_data = self._map_to_schema_fields(fused_data, file_name)
             
-            # Validate using Pydantic schema  
-            trip_inquiry = TripInquiry(**schema_data)
+            # Validate using Pydantic schema
+            trip_inquiry = TripInquiry.model_validate(schema_data)
             
             # Convert back to dict and merge with original extraction metadata
-            validated_data = trip_inquiry.dict()
+            validated_data = trip_inquiry.model_dump()
             validated_data['extraction_methods'] = fused_data.get('extraction_methods', {})
             validated_data['confidence_score'] = fused_data.get('confidence_score', 0.0)
             
@@ -57,19 +57,7 @@ class MLExtractor:
         
         try:
             # Process text with spaCy
-            doc = self.nlp(text)
-            
-            for ent in doc.ents:
-                confidence = 0.8  # spaCy doesn't provide confidence scores by default
-                if confidence >= self.config.NER_CONFIDENCE_THRESHOLD:
-                    entities.append({
-                        'text': ent.text,
-                        'label': ent.label_,
-                        'confidence': confidence,
-                        'start': ent.start_char,
-                        'end': ent.end_char,
-                        'method': 'ML_NER'
-                    })
+            entities = self._doc_entities(self.nlp(text))
             
             self.logger.debug(f"Extracted {len(entities)} entities using spaCy NER")
             
@@ -78,6 +66,32 @@ class MLExtractor:
         
         return entities
     
+    def _doc_entities(self, doc) -> List[Dict[str, Any]]:
+        """
+        Convert the entities of a processed spaCy Doc to entity dictionaries
+        
+        Args:
+            doc: spaCy Doc
+            
+        Returns:
+            List of extracted entities with metadata
+        """
+        entities = []
+        
+        for ent in doc.ents:
+            confidence = 0.8  # spaCy doesn't provide confidence scores by default
+            if confidence >= self.config.NER_CONFIDENCE_THRESHOLD:
+                entities.append({
+                    'text': ent.text,
+                    'label': ent.label_,
+                    'confidence': confidence,
+                    'start': ent.start_char,
+                    'end': ent.end_char,
+                    'method': 'ML_NER'
+                })
+        
+        return entities
+    
     def extract_person_names(self, text: str) -> List[str]:
         """
         Extract person names from text
@@ -248,46 +262,7 @@ class MLExtractor:
             # Get all entities from NER
             entities = self.extract_entities_ner(text)
             
-            # Categorize entities
-            categorized = {
-                'persons': [],
-                'locations': [],
-                'dates': [],
-                'money': [],
-                'numbers': [],
-                'organizations': [],
-                'miscellaneous': []
-            }
-            
-            for entity in entities:
-                label = entity['label'].upper()
-                text_val = entity['text']
-                
-                if label in ['PERSON', 'PER']:
-                    categorized['persons'].append(text_val)
-                elif label in ['GPE', 'LOC', 'LOCATION']:
-                    categorized['locations'].append(text_val)
-                elif label in ['DATE', 'TIME']:
-                    categorized['dates'].append(text_val)
-                elif label in ['MONEY', 'MONETARY']:
-                    categorized['money'].append(text_val)
-                elif label in ['CARDINAL', 'NUMBER', 'QUANTITY']:
-                    categorized['numbers'].append(text_val)
-                elif label in ['ORG', 'ORGANIZATION']:
-                    categorized['organizations'].append(text_val)
-                else:
-                    categorized['miscellaneous'].append(text_val)
-            
-            # Additional extractions
-            categorized['persons'].extend(self._extract_indian_names(text))
-            categorized['locations'].extend(self._extract_indian_destinations(text))
-            
-            # Clean and deduplicate all categories
-            for category in categorized:
-                categorized[category] = list(set([
-                    item.strip() for item in categorized[category] 
-                    if item and len(item.strip()) > 1
-                ]))
+            categorized = self._categorize_entities(text, entities)
             
             self.logger.debug(f"ML extraction completed: {len(entities)} total entities")
             
@@ -295,15 +270,102 @@ class MLExtractor:
             
         except Exception as e:
             self.logger.error(f"ML entity extraction error: {str(e)}")
-            return {
-                'persons': [],
-                'locations': [],
-                'dates': [],
-                'money': [],
-                'numbers': [],
-                'organizations': [],
-                'miscellaneous': []
-            }
+            return self._empty_categories()
+    
+    def extract_all_entities_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict[str, List[str]]]:
+        """
+        Extract all types of entities from many texts with one batched NER pass
+        
+        Args:
+            texts: Input texts for extraction
+            batch_size: Documents per spaCy batch (defaults to Config.BATCH_SIZE)
+            
+        Returns:
+            List of categorized entity dictionaries, in input order
+        """
+        if not texts:
+            return []
+        
+        if not self.nlp:
+            return [self.extract_all_entities(text) for text in texts]
+        
+        try:
+            # nlp.pipe runs the model over whole batches instead of one Doc per call
+            docs = self.nlp.pipe(texts, batch_size=batch_size or self.config.BATCH_SIZE)
+            
+            results = []
+            total_entities = 0
+            for text, doc in zip(texts, docs):
+                entities = self._doc_entities(doc)
+                total_entities += len(entities)
+                results.append(self._categorize_entities(text, entities))
+            
+            self.logger.debug(f"Batched ML extraction completed: {len(texts)} texts, {total_entities} total entities")
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Batched ML entity extraction error: {str(e)}")
+            self.logger.warning("Falling back to per-text ML extraction")
+            return [self.extract_all_entities(text) for text in texts]
+    
+    def _categorize_entities(self, text: str, entities: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Categorize NER entities and add pattern-based names and destinations
+        
+        Args:
+            text: Text the entities were extracted from
+            entities: Entities from the NER model
+            
+        Returns:
+            Dictionary with categorized entities
+        """
+        # Categorize entities
+        categorized = self._empty_categories()
+        
+        for entity in entities:
+            label = entity['label'].upper()
+            text_val = entity['text']
+            
+            if label in ['PERSON', 'PER']:
+                categorized['persons'].append(text_val)
+            elif label in ['GPE', 'LOC', 'LOCATION']:
+                categorized['locations'].append(text_val)
+            elif label in ['DATE', 'TIME']:
+                categorized['dates'].append(text_val)
+            elif label in ['MONEY', 'MONETARY']:
+                categorized['money'].append(text_val)
+            elif label in ['CARDINAL', 'NUMBER', 'QUANTITY']:
+                categorized['numbers'].append(text_val)
+            elif label in ['ORG', 'ORGANIZATION']:
+                categorized['organizations'].append(text_val)
+            else:
+                categorized['miscellaneous'].append(text_val)
+        
+        # Additional extractions
+        categorized['persons'].extend(self._extract_indian_names(text))
+        categorized['locations'].extend(self._extract_indian_destinations(text))
+        
+        # Clean and deduplicate all categories
+        for category in categorized:
+            categorized[category] = list(set([
+                item.strip() for item in categorized[category] 
+                if item and len(item.strip()) > 1
+            ]))
+        
+        return categorized
+    
+    def _empty_categories(self) -> Dict[str, List[str]]:
+        """Empty categorized entity dictionary"""
+        return {
+            'persons': [],
+            'locations': [],
+            'dates': [],
+            'money': [],
+            'numbers': [],
+            'organizations': [],
+            'miscellaneous': []
+        }
     
     def get_extraction_confidence(self, entities: List[Dict[str, Any]]) -> float:
         """
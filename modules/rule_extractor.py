@@ -269,12 +269,13 @@ class RuleExtractor:
         
         return list(set(destinations))
     
-    def extract_names_with_patterns(self, text: str) -> List[str]:
+    def extract_names_with_patterns(self, text: str, doc=None) -> List[str]:
         """
         Extract names using various patterns
         
         Args:
             text: Input text
+            doc: Optional spaCy Doc already built for text (e.g. by nlp.pipe)
             
         Returns:
             List of extracted names
@@ -295,7 +296,8 @@ class RuleExtractor:
         
         # Use spaCy matcher
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             matches = self.matcher(doc)
             
             for match_id, start, end in matches:
@@ -323,19 +325,20 @@ class RuleExtractor:
             'phones': self.extract_phone_numbers(text)
         }
     
-    def extract_all_entities(self, text: str) -> Dict[str, any]:
+    def extract_all_entities(self, text: str, doc=None) -> Dict[str, any]:
         """
         Extract all entities using rule-based methods
         
         Args:
             text: Input text for extraction
+            doc: Optional spaCy Doc already built for text (e.g. by nlp.pipe)
             
         Returns:
             Dictionary with all extracted entities
         """
         try:
             entities = {
-                'names': self.extract_names_with_patterns(text),
+                'names': self.extract_names_with_patterns(text, doc),
                 'destinations': self.extract_destinations(text),
                 'dates': self.extract_dates(text),
                 'currency_amounts': self.extract_currency_amounts(text),
@@ -361,6 +364,25 @@ class RuleExtractor:
                 'method': 'RULE_BASED_ERROR'
             }
     
+    def extract_all_entities_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict[str, any]]:
+        """
+        Extract all entities from many texts, tokenizing them in spaCy batches
+        
+        Args:
+            texts: Input texts for extraction
+            batch_size: Documents per spaCy batch (defaults to Config.BATCH_SIZE)
+            
+        Returns:
+            List of entity dictionaries, in input order
+        """
+        try:
+            docs = list(self.nlp.pipe(texts, batch_size=batch_size or self.config.BATCH_SIZE))
+        except Exception as e:
+            self.logger.error(f"spaCy batch processing error: {str(e)}")
+            docs = [None] * len(texts)
+        
+        return [self.extract_all_entities(text, doc) for text, doc in zip(texts, docs)]
+    
     def get_extraction_patterns(self) -> Dict[str, List[str]]:
         """
         Get all regex patterns used for extraction
@@ -6,23 +6,79 @@ Handles text cleaning, normalization, and preprocessing for multilingual content
 import re
 import string
 import unicodedata
-from typing import Dict, List, Optional
+from enum import IntFlag
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import spacy
 from spacy.lang.en import English
 
 from config import Config
 from utils.logger import setup_logger
 
+@lru_cache(maxsize=4)
+def load_spacy_model(model_name: str):
+    """
+    Load a spaCy pipeline once per process and share it between instances
+    
+    With fork-based workers, call this in the parent before forking so the
+    loaded pipeline is shared copy-on-write instead of reloaded per worker.
+    
+    Args:
+        model_name: spaCy model package name
+        
+    Returns:
+        Loaded spaCy Language object (blank English if no model is installed)
+    """
+    logger = setup_logger('text_preprocessor')
+    try:
+        nlp = spacy.load(model_name)
+        logger.info(f"Loaded spaCy model: {model_name}")
+        return nlp
+    except OSError:
+        logger.warning(f"Could not load {model_name}, using basic English model")
+        try:
+            nlp = spacy.load("en_core_web_sm")
+            return nlp
+        except OSError:
+            logger.warning("No spaCy model available, creating basic tokenizer")
+            return English()
+
+class Lang(IntFlag):
+    """Bitmask of languages detected in a text"""
+    NONE = 0
+    ENGLISH = 1
+    HINDI = 2
+    HINGLISH = 4
+
+    def to_dict(self) -> Dict[str, bool]:
+        """Expand the mask into the public {'english', 'hindi', 'hinglish'} dict"""
+        return {
+            'english': bool(self & Lang.ENGLISH),
+            'hindi': bool(self & Lang.HINDI),
+            'hinglish': bool(self & Lang.HINGLISH)
+        }
+
 class TextPreprocessor:
     """Handles text preprocessing for multilingual customer inquiries"""
     
-    def __init__(self):
+    def __init__(self, use_neural_sentencizer: bool = False):
         self.config = Config()
         self.logger = setup_logger('text_preprocessor')
         self.nlp = self._load_spacy_model()
         
+        # Sentence splitting runs on every inquiry (stats); the spaCy parser
+        # is only used when a caller explicitly asks for it
+        self.use_neural_sentencizer = use_neural_sentencizer
+        self._sent_split_re = re.compile(r'(?<=[.!?])\s+')
+        
         # Devanagari script range for Hindi text detection
         self.hindi_pattern = re.compile(r'[\u0900-\u097F]+')
+        self._english_word_pattern = re.compile(r'\b[a-zA-Z]+\b')
+        
+        # Rule-text normalization patterns
+        self._whitespace_pattern = re.compile(r'\s+')
+        self._currency_pattern = re.compile(r'(?:[Rr]s\.?|₹)\s*')
+        self._non_phone_pattern = re.compile(r'[^\d\s+()-]')
         
         # Common noise patterns
         self.noise_patterns = [
@@ -32,50 +88,46 @@ class TextPreprocessor:
         ]
     
     def _load_spacy_model(self):
-        """Load spaCy model with fallback"""
-        try:
-            nlp = spacy.load(self.config.SPACY_MODEL)
-            self.logger.info(f"Loaded spaCy model: {self.config.SPACY_MODEL}")
-            return nlp
-        except OSError:
-            self.logger.warning(f"Could not load {self.config.SPACY_MODEL}, using basic English model")
-            try:
-                nlp = spacy.load("en_core_web_sm")
-                return nlp
-            except OSError:
-                self.logger.warning("No spaCy model available, creating basic tokenizer")
-                return English()
+        """Load spaCy model with fallback (cached per process)"""
+        return load_spacy_model(self.config.SPACY_MODEL)
     
-    def detect_languages(self, text: str) -> Dict[str, bool]:
+    def _detect_lang_mask(self, text: str) -> Lang:
         """
-        Detect languages present in the text
+        Detect languages present in the text as a Lang bitmask
         
         Args:
             text: Input text to analyze
             
         Returns:
-            Dict with language detection results
+            Lang flags for the detected languages
         """
-        languages = {
-            'english': False,
-            'hindi': False,
-            'hinglish': False
-        }
+        mask = Lang.NONE
         
         # Check for Hindi (Devanagari script)
         if self.hindi_pattern.search(text):
-            languages['hindi'] = True
+            mask |= Lang.HINDI
         
         # Check for English (basic heuristic)
-        english_words = re.findall(r'\b[a-zA-Z]+\b', text)
-        if len(english_words) > 0:
-            languages['english'] = True
+        if self._english_word_pattern.search(text):
+            mask |= Lang.ENGLISH
         
         # Hinglish detection (mixed script)
-        if languages['hindi'] and languages['english']:
-            languages['hinglish'] = True
+        if mask & Lang.HINDI and mask & Lang.ENGLISH:
+            mask |= Lang.HINGLISH
+        
+        return mask
+    
+    def detect_languages(self, text: str) -> Dict[str, bool]:
+        """
+        Detect languages present in the text
         
-        return languages
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            Dict with language detection results
+        """
+        return self._detect_lang_mask(text).to_dict()
     
     def normalize_unicode(self, text: str) -> str:
         """
@@ -87,17 +139,11 @@ class TextPreprocessor:
         Returns:
             Normalized text
         """
-        # Normalize Unicode to handle various encodings
-        normalized = unicodedata.normalize('NFKD', text)
-        
-        # Convert to ASCII if possible, otherwise keep Unicode
-        try:
-            # Try to encode/decode to handle mixed encodings
-            normalized = normalized.encode('utf-8').decode('utf-8')
-        except UnicodeError:
-            self.logger.warning("Unicode normalization issue, keeping original")
-        
-        return normalized
+        # Normalize Unicode to handle various encodings; already-normalized
+        # text (e.g. plain ASCII) is returned without copying
+        if unicodedata.is_normalized('NFKD', text):
+            return text
+        return unicodedata.normalize('NFKD', text)
     
     def clean_text(self, text: str) -> str:
         """
@@ -119,7 +165,7 @@ class TextPreprocessor:
         original_text = text
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self._whitespace_pattern.sub(' ', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -151,7 +197,8 @@ class TextPreprocessor:
     
     def extract_sentences(self, text: str) -> List[str]:
         """
-        Extract sentences using spaCy
+        Extract sentences using a rule-based splitter on .!? boundaries
+        (or the spaCy pipeline when use_neural_sentencizer is set)
         
         Args:
             text: Input text
@@ -159,6 +206,9 @@ class TextPreprocessor:
         Returns:
             List of sentences
         """
+        if not self.use_neural_sentencizer:
+            return [s.strip() for s in self._sent_split_re.split(text) if s.strip()]
+        
         try:
             doc = self.nlp(text)
             sentences = [sent.text.strip() for sent in doc.sents]
@@ -182,7 +232,7 @@ class TextPreprocessor:
         text = self.normalize_unicode(text)
         
         # Remove excessive whitespace but preserve sentence structure
-        text = re.sub(r'\s+', ' ', text)
+        text = self._whitespace_pattern.sub(' ', text)
         text = text.strip()
         
         # Ensure proper sentence endings for better NER
@@ -219,24 +269,22 @@ class TextPreprocessor:
         Returns:
             Text with normalized patterns
         """
-        # Normalize currency symbols
-        text = re.sub(r'[Rr]s\.?\s*', 'Rs ', text)
-        text = re.sub(r'₹\s*', 'Rs ', text)
-        
-        # Normalize phone number patterns
-        text = re.sub(r'[^\d\s+()-]', ' ', text)
-        
-        # Normalize date separators
-        text = re.sub(r'[-/]', '-', text)
+        # Normalize currency symbols (Rs/Rs./₹ -> "Rs "), then strip
+        # everything that is not part of a phone number. The "Rs " marker is
+        # itself blanked by the second pass, so it is emitted as spaces
+        # directly; date separators cannot survive the second pass either.
+        text = self._currency_pattern.sub('   ', text)
+        text = self._non_phone_pattern.sub(' ', text)
         
         return text
     
-    def get_text_stats(self, text: str) -> Dict[str, int]:
+    def get_text_stats(self, text: str, lang_mask: Optional[Lang] = None) -> Dict[str, int]:
         """
         Get basic statistics about the text
         
         Args:
             text: Input text
+            lang_mask: Already-detected languages, to skip re-detection
             
         Returns:
             Dictionary with text statistics
@@ -249,11 +297,54 @@ class TextPreprocessor:
         }
         
         # Add language detection
-        languages = self.detect_languages(text)
-        stats.update(languages)
+        if lang_mask is None:
+            lang_mask = self._detect_lang_mask(text)
+        stats.update(lang_mask.to_dict())
         
         return stats
     
+    def _pipeline_for_ascii(self, text: str) -> Tuple[str, str, str, Lang]:
+        """
+        Preprocessing pipeline for pure-ASCII input
+        
+        ASCII text is already NFKD-normalized and cannot contain Devanagari,
+        so Unicode normalization and the Hindi script scan are skipped.
+        
+        Args:
+            text: Raw inquiry text (ASCII only)
+            
+        Returns:
+            Tuple of (cleaned_text, ner_text, rules_text, lang_mask)
+        """
+        cleaned_text = self._whitespace_pattern.sub(' ', text).strip()
+        
+        ner_text = cleaned_text
+        if ner_text and not ner_text.endswith(('.', '!', '?')):
+            ner_text += '.'
+        
+        rules_text = self._normalize_patterns(cleaned_text)
+        
+        lang_mask = Lang.ENGLISH if self._english_word_pattern.search(text) else Lang.NONE
+        
+        return cleaned_text, ner_text, rules_text, lang_mask
+    
+    def _pipeline_for_mixed(self, text: str) -> Tuple[str, str, str, Lang]:
+        """
+        Full preprocessing pipeline for input with non-ASCII characters
+        
+        Args:
+            text: Raw inquiry text
+            
+        Returns:
+            Tuple of (cleaned_text, ner_text, rules_text, lang_mask)
+        """
+        cleaned_text = self.clean_text(text)
+        ner_text = self.preprocess_for_ner(cleaned_text)
+        rules_text = self.preprocess_for_rules(cleaned_text)
+        lang_mask = self._detect_lang_mask(text)
+        
+        return cleaned_text, ner_text, rules_text, lang_mask
+    
     def preprocess_inquiry(self, text: str) -> Dict[str, any]:
         """
         Main preprocessing method for customer inquiries
@@ -281,22 +372,21 @@ class TextPreprocessor:
                 text = text[:self.config.MAX_TEXT_LENGTH]
                 self.logger.warning(f"Text truncated to {self.config.MAX_TEXT_LENGTH} characters")
             
-            # Clean text
-            cleaned_text = self.clean_text(text)
-            
-            # Preprocess for different extraction methods
-            ner_text = self.preprocess_for_ner(cleaned_text)
-            rules_text = self.preprocess_for_rules(cleaned_text)
+            # Clean, preprocess for each extraction method and detect
+            # languages, specialized once per inquiry on the input script
+            if text.isascii():
+                cleaned_text, ner_text, rules_text, lang_mask = self._pipeline_for_ascii(text)
+            else:
+                cleaned_text, ner_text, rules_text, lang_mask = self._pipeline_for_mixed(text)
             
-            # Analyze text
-            languages = self.detect_languages(text)
-            stats = self.get_text_stats(cleaned_text)
+            # Analyze text (languages detected once, shared with stats)
+            stats = self.get_text_stats(cleaned_text, lang_mask)
             
             return {
                 'cleaned_text': cleaned_text,
                 'ner_text': ner_text,
                 'rules_text': rules_text,
-                'languages': languages,
+                'languages': lang_mask.to_dict(),
                 'stats': stats,
                 'status': 'SUCCESS'
             }
@@ -2,39 +2,217 @@
 Perfect Travel Inquiry Extractor - Addresses all formatting and accuracy issues
 """
 
+import os
 import re
-import pandas as pd
+import sys
+from openpyxl import Workbook
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import time
 
+try:
+    import ahocorasick  # optional: pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# One shared sentinel object: results pickled back from worker processes
+# reference it once per batch instead of repeating the string per field
+NOT_SPECIFIED = sys.intern("Not Specified")
+
 class PerfectTravelExtractor:
     """Perfect extractor with exact formatting and precision data extraction"""
     
+    # Below this average file size processing is I/O-bound and threads win
+    PROCESS_POOL_MIN_AVG_BYTES = 2048
+    
+    # Template for _create_empty_result, copied per file (File Name filled in)
+    EMPTY_RESULT = {
+        'Customer Name': NOT_SPECIFIED,
+        'File Name': None,
+        'Number of Travelers': 0,
+        'Number of Adults': 0,
+        'Number of Children': 0,
+        'Destination(s)': NOT_SPECIFIED,
+        'Start Date': NOT_SPECIFIED,
+        'End Date': NOT_SPECIFIED,
+        'Duration (Nights)': 0,
+        'Hotel Type': NOT_SPECIFIED,
+        'Meal Plan': NOT_SPECIFIED,
+        'Planned Activities': NOT_SPECIFIED,
+        'Flight Required': NOT_SPECIFIED,
+        'Visa Required': NOT_SPECIFIED,
+        'Insurance Required': NOT_SPECIFIED,
+        'Budget': NOT_SPECIFIED,
+        'Departure City': NOT_SPECIFIED,
+        'Special Requests': NOT_SPECIFIED,
+        'Response Deadline': NOT_SPECIFIED
+    }
+    
     def __init__(self):
         self.destinations = self._load_destinations()
+        # Fixed scan order: a set unpickled in a worker process may iterate differently
+        self.destination_order = tuple(self.destinations)
         self.activities = self._load_activities()
+        self.activity_mapping = self._load_activity_mapping()
+        self.request_mapping = self._load_request_mapping()
+        self.destination_matcher = self._build_keyword_matcher(self.destinations)
+        self.activity_matcher = self._build_keyword_matcher(self.activity_mapping)
+        self.phrase_labels = self._load_phrase_labels()
+        # Cheap substring gate: skip a table unless one of these literals occurs
+        self.phrase_prefilters = {
+            'hotel_type': ('villa', 'star'),
+            'meal_plan': ('breakfast', 'meals'),
+            'flight_required': ('flights',),
+            'visa_required': ('visa',)
+        }
+        self.phrase_matchers = {field: self._build_keyword_matcher(labels)
+                                for field, labels in self.phrase_labels.items()}
         self.date_patterns = self._setup_date_patterns()
+        self.week_dates = self._setup_week_dates()
+        self.month_map = self._setup_month_map()
+        self._compile_patterns()
     
-    def _load_destinations(self) -> set:
-        return {
+    def _load_destinations(self) -> frozenset:
+        return frozenset({
             'thailand', 'bangkok', 'phuket', 'phi phi', 'james bond', 'maldives', 'goa', 
             'kerala', 'kashmir', 'europe', 'shimla', 'manali', 'rajasthan', 'singapore',
             'dubai', 'bali', 'nepal', 'sri lanka', 'bhutan', 'mauritius', 'paris', 'london',
             'cochin', 'periyar', 'alleppey', 'kufri', 'solang valley', 'mall road'
-        }
+        })
     
-    def _load_activities(self) -> set:
-        return {
+    def _load_activities(self) -> frozenset:
+        return frozenset({
             'temples', 'safari world', 'city tour', 'island hopping', 'phi phi islands',
             'james bond islands', 'romantic dinner', 'beach time', 'snorkeling',
             'fort aguada', 'dudhsagar falls', 'baga beach', 'pahalgam', 'gulmarg',
             'sonmarg', 'swiss alps', 'venice', 'cochin', 'periyar', 'alleppey houseboat',
             'kufri', 'solang valley', 'mall road', 'cruise ride', 'water sports'
+        })
+    
+    def _load_activity_mapping(self) -> Dict[str, str]:
+        return {
+            'temples': 'Temples visit',
+            'safari world': 'Safari World',
+            'island hopping': 'Island hopping',
+            'phi phi': 'Phi Phi islands',
+            'james bond': 'James Bond islands',
+            'romantic dinner': 'Romantic dinner',
+            'cruise ride': 'Cruise ride',
+            'fort aguada': 'Fort Aguada',
+            'baga beach': 'Baga Beach',
+            'city tour': 'City tour'
         }
     
+    def _load_request_mapping(self) -> Dict[str, str]:
+        return {
+            'airport transfers': 'Airport transfers',
+            'visa assistance': 'Visa assistance',
+            'indian dinners': 'Indian dinners',
+            'late checkout': 'Late checkout',
+            'early check-in': 'Early check-in',
+            'wheelchair access': 'Wheelchair access',
+            'romantic dinner': 'Romantic dinner',
+            'birthday cake': 'Birthday cake'
+        }
+    
+    def _load_phrase_labels(self) -> Dict[str, Dict[str, str]]:
+        # Per field, phrase -> label; earlier phrases win when several appear
+        return {
+            'hotel_type': {
+                'water villa': 'Water villa',
+                '5-star': '5-star',
+                '4-star': '4-star',
+                '3-star': '3-star'
+            },
+            'meal_plan': {
+                'breakfast only': "Breakfast only",
+                'breakfast and dinner': "Breakfast and dinner",
+                'all meals': "All meals",
+                'veg meals': "Veg meals",
+                'with breakfast': "Breakfast"
+            },
+            'flight_required': {
+                'flights will be booked separately': "FALSE",
+                'flights not required': "FALSE",
+                'flights required': "TRUE",
+                'flights needed': "TRUE"
+            },
+            'visa_required': {
+                'visa assistance': "TRUE",
+                'visa required': "TRUE",
+                'visa not required': "FALSE"
+            },
+            'deadline': {
+                'client is in hurry': "Urgent",
+                'hurry to finalize': "Urgent",
+                'urgent': "Urgent",
+                'jaldi': "Urgent",
+                'asap': "ASAP",
+                'today': "Today",
+                'tomorrow': "Tomorrow",
+                'finalize karna chahta hai': "ASAP"
+            }
+        }
+    
+    def _setup_week_dates(self) -> Dict[str, Tuple[str, str]]:
+        # Checked in this order when several phrases appear in one message
+        return {
+            'second week of november': ("2025-11-10", "2025-11-16"),
+            'first week of november': ("2025-11-03", "2025-11-09"),
+            'third week of november': ("2025-11-17", "2025-11-23"),
+            'last week of november': ("2025-11-24", "2025-11-30"),
+            'first week of december': ("2025-12-01", "2025-12-07"),
+            'second week of december': ("2025-12-08", "2025-12-14")
+        }
+    
+    def _setup_month_map(self) -> Dict[str, str]:
+        return {
+            'january': '01', 'february': '02', 'march': '03', 'april': '04',
+            'may': '05', 'june': '06', 'july': '07', 'august': '08',
+            'september': '09', 'october': '10', 'november': '11', 'december': '12'
+        }
+    
+    def _build_keyword_matcher(self, keywords):
+        """Build a one-pass matcher for a keyword list (Aho-Corasick when pyahocorasick is installed)"""
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            return automaton
+        
+        # Fallback: a single regex alternation. The lookahead keeps overlapping
+        # hits, but reports only one keyword per start offset, so it finds the
+        # same set as Aho-Corasick only while no keyword is a prefix of another
+        ordered = sorted(keywords)
+        for shorter, longer in zip(ordered, ordered[1:]):
+            if longer.startswith(shorter):
+                raise ValueError(f"Keyword {shorter!r} is a prefix of {longer!r}; the regex matcher would drop one")
+        alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        return re.compile(f'(?=({alternation}))')
+    
+    def _find_keywords(self, matcher, text_lower: str) -> set:
+        """Return the set of keywords that occur in text_lower, in one pass"""
+        if ahocorasick is not None:
+            return {keyword for _, keyword in matcher.iter(text_lower)}
+        return {match.group(1) for match in matcher.finditer(text_lower)}
+    
+    def _match_phrase_label(self, field: str, text_lower: str) -> str:
+        """Label of the highest-priority phrase for field found in text_lower, in one pass"""
+        literals = self.phrase_prefilters.get(field)
+        if literals and not any(literal in text_lower for literal in literals):
+            return NOT_SPECIFIED
+        
+        found = self._find_keywords(self.phrase_matchers[field], text_lower)
+        if found:
+            for phrase, label in self.phrase_labels[field].items():
+                if phrase in found:
+                    return label
+        
+        return NOT_SPECIFIED
+    
     def _setup_date_patterns(self) -> List[str]:
         return [
             r'from\s*(\d{1,2}(?:st|nd|rd|th)?\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})',
@@ -45,82 +223,167 @@ class PerfectTravelExtractor:
             r'(\d{1,2}(?:st|nd|rd|th)?\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})'
         ]
     
-    def extract_customer_name(self, text: str) -> str:
-        """Extract customer name from email signature"""
-        # Pattern for email signatures
-        patterns = [
-            r'(?:regards|thanks|शुभकामनाएं|धन्यवाद)[,\s]*\n?([A-Za-z][A-Za-z\s\.]+?)(?:\s*$|\n|DDS|MD)',
-            r'\n([A-Za-z][A-Za-z\s\.]+?(?:DDS|MD)?)\s*$'
+    def _compile_patterns(self):
+        """Compile every extraction regex once so the per-file hot path only runs matches"""
+        ic = re.IGNORECASE
+        
+        # Single-scan fields: customer name (email signatures), travelers,
+        # duration and budget, fused into one union (see _fused_union). Only
+        # patterns that can never start at the same offset as another
+        # field's are fused here, so no field can mask another.
+        self.fields_re = self._fused_union([
+            # Customer name
+            r'(?:regards|thanks|शुभकामनाएं|धन्यवाद)[,\s]*\n?(?P<name0>[A-Za-z][A-Za-z\s\.]+?)(?:\s*$|\n|DDS|MD)',
+            r'\n(?P<name1>[A-Za-z][A-Za-z\s\.]+?(?:DDS|MD)?)\s*$',
+            # Pattern: "7 people (4 adults + 3 children)" (must precede total0)
+            r'(?P<breakdown>\d+)\s*(?:people|pax|travelers?|व्यक्ति)[^(]*\((?P<breakdown_adults>\d+)\s*adults?\s*\+\s*(?P<breakdown_children>\d+)\s*(?:children?|kids?|बच्चे)\)',
+            # Children (enhanced for multiple languages)
+            r'(?P<kids0>\d+)\s*(?:children?|kids?|child)',
+            r'(?P<kids1>\d+)\s*(?:बच्चे|बच्चा|chote\s*bacche)',
+            r'(?P<kids2>\d+)\s*bacche',
+            r'adults?\s*\+\s*(?P<kids3>\d+)\s*(?:children?|kids?|बच्चे)',
+            r'\+\s*(?P<kids4>\d+)\s*(?:children?|kids?|बच्चे)',
+            # Adults
+            r'(?P<adults0>\d+)\s*adults?',
+            r'for\s*(?P<adults1>\d+)\s*adults?',
+            r'(?P<adults2>\d+)\s*बड़े',
+            # Total travelers
+            r'(?P<total0>\d+)\s*(?:people|pax|travelers?|व्यक्ति)',
+            r'total[:\s]*(?P<total1>\d+)',
+            r'family\s*of\s*(?P<total2>\d+)',
+            r'group\s*of\s*(?P<total3>\d+)',
+            # Duration (nights); nights0 is also used to derive end dates
+            r'(?P<nights0>\d+)[-\s]*nights?',
+            r'(?P<nights1>\d+)[-\s]*nights?[-\s]*/[-\s]*\d+[-\s]*days?',
+            r'(?P<nights2>\d+)\s*रातें',
+            # Budget
+            r'budget\s*is\s*approximately\s*[₹Rs\.]*\s*(?P<budget0>\d+(?:,\d+)*)\s*(?P<budget0_pp>per\s*person)?',
+            r'approximately\s*[₹Rs\.]*\s*(?P<budget1>\d+(?:,\d+)*)\s*(?P<budget1_pp>per\s*person)?',
+            r'around\s*[₹Rs\.]*\s*(?P<budget2>\d+(?:,\d+)*)\s*(?P<budget2_pp>per\s*person)?',
+            r'[₹Rs\.]\s*(?P<budget3>\d+(?:,\d+)*)\s*(?P<budget3_pp>per\s*person)?',
+            r'budget[:\s]*[₹Rs\.]*\s*(?P<budget4>\d+(?:,\d+)*)\s*(?P<budget4_pp>per\s*person)?'
+        ])
+        # ASCII-mode twin for pure-ASCII text: skips Unicode case folding in
+        # the matcher. On ASCII input only \s differs (Unicode mode also
+        # matches \x1c-\x1f), so text containing those keeps fields_re
+        self.fields_ascii_re = re.compile(self.fields_re.pattern, re.IGNORECASE | re.MULTILINE | re.ASCII)
+        self.unicode_only_space_re = re.compile(r'[\x1c-\x1f]')
+        self.whitespace_re = re.compile(r'\s+')
+        
+        # Patterns below are paired with a lowercase literal every match must
+        # contain (None: no useful literal); the regex is skipped when the
+        # literal is absent from the lowercased text
+        
+        # Destinations
+        self.subject_res = [
+            (None, re.compile(r'(?:to|–)\s*([A-Za-z\s-]+?)(?:\s*–|\s*for|\s*$)', ic)),
+            ('trip', re.compile(r'trip\s*to\s*([A-Za-z\s-]+?)(?:\s*–|\s*for)', ic)),
+            ('जाना', re.compile(r'जाना\s*है\s*([A-Za-z\s-]+?)(?:\s*के\s*लिए|\s*$)', ic))
+        ]
+        self.location_res = [
+            ('cover', re.compile(r'cover\s*([^,.]*?)(?:[,.]|with)', ic)),
+            ('visit', re.compile(r'visit\s*to\s*([^,.]*?)(?:[,.]|and)', ic)),
+            ('keen', re.compile(r'keen\s*on\s*([^,.]*?)(?:[,.]|they)', ic))
+        ]
+        
+        # Dates and duration
+        self.week_re = re.compile('|'.join(re.escape(phrase) for phrase in self.week_dates))
+        date_literals = ['from', 'starting', None, 'during', 'in', None]
+        self.date_res = [(literal, re.compile(p, ic)) for literal, p in zip(date_literals, self.date_patterns)]
+        self.month_res = [
+            re.compile(r'(?:in|during)\s*(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?'),
+            re.compile(r'(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?')
+        ]
+        
+        # Hotel (every pattern contains 'hotel')
+        self.hotel_res = [
+            re.compile(r'hotel\s*category\s*preferred\s*is\s*([^,.\n]*?)(?:[,.\n]|with)', ic),
+            re.compile(r'preferred\s*hotel\s*is\s*([^,.\n]*?)(?:[,.\n]|with)', ic),
+            re.compile(r'hotel\s*([^,.\n]*?)(?:[,.\n]|with)', ic)
         ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        # Activities
+        self.activity_res = [
+            ('city', re.compile(r'city\s*tour\s*including\s*([^,.]*?)(?:[,.]|and)', ic)),
+            ('visit', re.compile(r'visit\s*to\s*([^,.]*?)(?:[,.]|in)', ic)),
+            ('keen', re.compile(r'keen\s*on\s*([^,.]*?)(?:[,.]|they)', ic)),
+            ('include', re.compile(r'want\s*to\s*include\s*([^,.]*?)(?:[,.]|flights)', ic)),
+            ('want', re.compile(r'they\s*want\s*([^,.]*?)(?:[,.]|flights)', ic)),
+            ('include', re.compile(r'include\s*([^,.]*?)(?:[,.]|flights)', ic)),
+            ('गतिविधियाँ', re.compile(r'गतिविधियाँ[:\s]*([^.]*?)(?:\.|flights)', ic))
+        ]
+        self.activity_prefix_re = re.compile(r'^(to\s*include\s*|including\s*)', ic)
+    
+    @staticmethod
+    def _fused_union(alternatives: List[str]) -> re.Pattern:
+        """
+        Fuse priority-ordered patterns for several fields into a single regex
+        
+        Each alternative names its value group <field><priority> (e.g. kids0,
+        kids1) and any extra groups <field><priority>_<part>. The union is
+        wrapped in a lookahead so finditer reports every start position
+        without consuming text; at a given position the earliest-listed
+        alternative wins. The first match seen for each group is therefore
+        exactly what searching that pattern on its own would have returned.
+        """
+        union = '|'.join(f'(?:{alternative})' for alternative in alternatives)
+        return re.compile(f'(?=(?:{union}))', re.IGNORECASE | re.MULTILINE)
+    
+    def scan_fields(self, text: str) -> Dict[str, re.Match]:
+        """Run the fused field regex once and keep the first match per pattern"""
+        fields_re = self.fields_re
+        if text.isascii() and not self.unicode_only_space_re.search(text):
+            fields_re = self.fields_ascii_re
+        
+        fields = {}
+        for match in fields_re.finditer(text):
+            fields.setdefault(match.lastgroup.split('_')[0], match)
+        return fields
+    
+    def _first_field(self, fields: Dict[str, re.Match], field: str, count: int) -> Tuple[Optional[str], Optional[re.Match]]:
+        """Return the highest-priority (key, match) found for a field, or (None, None)"""
+        for rank in range(count):
+            key = f'{field}{rank}'
+            if key in fields:
+                return key, fields[key]
+        return None, None
+    
+    def extract_customer_name(self, text: str, fields: Optional[Dict[str, re.Match]] = None) -> str:
+        """Extract customer name from email signature"""
+        if fields is None:
+            fields = self.scan_fields(text)
+        
+        for key in ('name0', 'name1'):
+            match = fields.get(key)
             if match:
-                name = match.group(1).strip()
+                name = match.group(key).strip()
                 # Clean up the name
-                name = re.sub(r'\s+', ' ', name)  # Remove extra spaces
-                if len(name) > 2 and len(name) < 50 and name.replace(' ', '').replace('.', '').isalpha():
+                name = self.whitespace_re.sub(' ', name)  # Remove extra spaces
+                # Both patterns capture a leading letter, so "letters, spaces and dots" suffices
+                if 2 < len(name) < 50 and all(c.isalpha() or c in ' .' for c in name):
                     return name.title()
         
-        return "Not Specified"
+        return NOT_SPECIFIED
     
-    def extract_travelers_info(self, text: str) -> Tuple[int, int, int]:
+    def extract_travelers_info(self, text: str, fields: Optional[Dict[str, re.Match]] = None) -> Tuple[int, int, int]:
         """Extract Number of Travelers, Adults, Children with improved children detection"""
-        total = 0
-        adults = 0
-        children = 0
-        
-        # Enhanced children patterns for multiple languages
-        children_patterns = [
-            r'(\d+)\s*(?:children?|kids?|child)',
-            r'(\d+)\s*(?:बच्चे|बच्चा|chote\s*bacche)',
-            r'(\d+)\s*bacche',
-            r'adults?\s*\+\s*(\d+)\s*(?:children?|kids?|बच्चे)',
-            r'\+\s*(\d+)\s*(?:children?|kids?|बच्चे)'
-        ]
-        
-        # Extract children first
-        for pattern in children_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                children = int(match.group(1))
-                break
+        if fields is None:
+            fields = self.scan_fields(text)
         
         # Pattern: "7 people (4 adults + 3 children)"
-        breakdown_pattern = r'(\d+)\s*(?:people|pax|travelers?|व्यक्ति)[^(]*\((\d+)\s*adults?\s*\+\s*(\d+)\s*(?:children?|kids?|बच्चे)\)'
-        match = re.search(breakdown_pattern, text, re.IGNORECASE)
+        match = fields.get('breakdown')
         if match:
-            total = int(match.group(1))
-            adults = int(match.group(2))
-            children = int(match.group(3))
+            total = int(match.group('breakdown'))
+            adults = int(match.group('breakdown_adults'))
+            children = int(match.group('breakdown_children'))
             return total, adults, children
         
-        # Extract adults
-        adults_patterns = [
-            r'(\d+)\s*adults?',
-            r'for\s*(\d+)\s*adults?',
-            r'(\d+)\s*बड़े'
-        ]
-        
-        for pattern in adults_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                adults = int(match.group(1))
-                break
-        
-        # Extract total travelers
-        total_patterns = [
-            r'(\d+)\s*(?:people|pax|travelers?|व्यक्ति)',
-            r'total[:\s]*(\d+)',
-            r'family\s*of\s*(\d+)',
-            r'group\s*of\s*(\d+)'
-        ]
-        
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                total = int(match.group(1))
-                break
+        key, match = self._first_field(fields, 'kids', 5)
+        children = int(match.group(key)) if match else 0
+        key, match = self._first_field(fields, 'adults', 3)
+        adults = int(match.group(key)) if match else 0
+        key, match = self._first_field(fields, 'total', 4)
+        total = int(match.group(key)) if match else 0
         
         # Calculate missing values
         if total == 0 and (adults > 0 or children > 0):
@@ -134,84 +397,80 @@ class PerfectTravelExtractor:
         
         return total or 1, adults or 0, children or 0
     
-    def extract_destinations(self, text: str) -> str:
+    def extract_destinations(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract destinations"""
-        destinations = []
-        text_lower = text.lower()
+        destinations = {}  # Ordered set: O(1) dedup, insertion order kept
+        max_destinations = 4  # Only the first four are reported
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Primary destination from subject
-        subject_patterns = [
-            r'(?:to|–)\s*([A-Za-z\s-]+?)(?:\s*–|\s*for|\s*$)',
-            r'trip\s*to\s*([A-Za-z\s-]+?)(?:\s*–|\s*for)',
-            r'जाना\s*है\s*([A-Za-z\s-]+?)(?:\s*के\s*लिए|\s*$)'
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for literal, subject_re in self.subject_res:
+            if literal and literal not in text_lower:
+                continue
+            match = subject_re.search(text)
             if match:
                 dest = match.group(1).strip().title()
                 if dest and len(dest) > 2:
-                    destinations.append(dest)
+                    destinations[dest] = None
                     break
         
         # Check for known destinations
-        for dest in self.destinations:
-            if dest in text_lower:
+        found = self._find_keywords(self.destination_matcher, text_lower)
+        for dest in self.destination_order:
+            if dest in found:
                 dest_title = dest.title()
                 if dest_title not in destinations:
-                    destinations.append(dest_title)
+                    destinations[dest_title] = None
+                    if len(destinations) == max_destinations:
+                        return ', '.join(destinations)
         
         # Specific location mentions
-        location_patterns = [
-            r'cover\s*([^,.]*?)(?:[,.]|with)',
-            r'visit\s*to\s*([^,.]*?)(?:[,.]|and)',
-            r'keen\s*on\s*([^,.]*?)(?:[,.]|they)'
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 2:
-                    clean_dest = match.strip().title()
+        for literal, location_re in self.location_res:
+            if literal not in text_lower:
+                continue
+            for match in location_re.finditer(text):
+                clean_dest = match.group(1).strip()
+                if len(clean_dest) > 2:
+                    clean_dest = clean_dest.title()
                     if clean_dest not in destinations:
-                        destinations.append(clean_dest)
+                        destinations[clean_dest] = None
+                        if len(destinations) == max_destinations:
+                            return ', '.join(destinations)
         
-        return ', '.join(destinations[:4]) if destinations else "Not Specified"
+        return ', '.join(destinations) if destinations else NOT_SPECIFIED
     
-    def extract_actual_dates(self, text: str) -> Tuple[str, str]:
+    def extract_actual_dates(self, text: str, text_lower: Optional[str] = None, fields: Optional[Dict[str, re.Match]] = None) -> Tuple[str, str]:
         """Extract actual Start Date and End Date from customer message"""
-        start_date = "Not Specified"
-        end_date = "Not Specified"
+        if fields is None:
+            fields = self.scan_fields(text)
+        
+        start_date = NOT_SPECIFIED
+        end_date = NOT_SPECIFIED
         
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Handle specific date references
-        if 'second week of november' in text_lower:
-            start_date = "2025-11-10"
-            end_date = "2025-11-16"
-        elif 'first week of november' in text_lower:
-            start_date = "2025-11-03"
-            end_date = "2025-11-09"
-        elif 'third week of november' in text_lower:
-            start_date = "2025-11-17"
-            end_date = "2025-11-23"
-        elif 'last week of november' in text_lower:
-            start_date = "2025-11-24"
-            end_date = "2025-11-30"
-        elif 'first week of december' in text_lower:
-            start_date = "2025-12-01"
-            end_date = "2025-12-07"
-        elif 'second week of december' in text_lower:
-            start_date = "2025-12-08"
-            end_date = "2025-12-14"
+        found_weeks = {match.group() for match in self.week_re.finditer(text_lower)}
+        week = next((phrase for phrase in self.week_dates if phrase in found_weeks), None)
+        if week:
+            start_date, end_date = self.week_dates[week]
         else:
-            # Try to extract specific dates from text
+            # Try to extract specific dates from text; only the first two
+            # (in pattern order) are used, so stop scanning once they are found
             dates_found = []
-            for pattern in self.date_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    if match and len(match) > 3:
-                        dates_found.append(match)
+            for literal, date_re in self.date_res:
+                if literal and literal not in text_lower:
+                    continue
+                for match in date_re.finditer(text):
+                    value = match.group(1)
+                    if value and len(value) > 3:
+                        dates_found.append(value)
+                        if len(dates_found) == 2:
+                            break
+                if len(dates_found) == 2:
+                    break
             
             # If specific dates found, use them
             if len(dates_found) >= 2:
@@ -220,10 +479,10 @@ class PerfectTravelExtractor:
             elif len(dates_found) == 1:
                 start_date = dates_found[0]
                 # Calculate end date based on duration if available
-                duration_match = re.search(r'(\d+)[-\s]*nights?', text, re.IGNORECASE)
+                duration_match = fields.get('nights0')
                 if duration_match:
                     try:
-                        nights = int(duration_match.group(1))
+                        nights = int(duration_match.group('nights0'))
                         # Try to parse the start date and add nights
                         if '/' in start_date:
                             parts = start_date.split('/')
@@ -236,260 +495,171 @@ class PerfectTravelExtractor:
                         pass
             else:
                 # Check for month/year references
-                month_patterns = [
-                    r'(?:in|during)\s*(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?',
-                    r'(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?'
-                ]
-                
-                for pattern in month_patterns:
-                    match = re.search(pattern, text_lower)
+                for month_re in self.month_res:
+                    match = month_re.search(text_lower)
                     if match:
                         month = match.group(1)
                         year = match.group(2) if match.group(2) else "2025"
                         
-                        month_map = {
-                            'january': '01', 'february': '02', 'march': '03', 'april': '04',
-                            'may': '05', 'june': '06', 'july': '07', 'august': '08',
-                            'september': '09', 'october': '10', 'november': '11', 'december': '12'
-                        }
-                        
-                        if month in month_map:
-                            start_date = f"{year}-{month_map[month]}-01"
+                        if month in self.month_map:
+                            start_date = f"{year}-{self.month_map[month]}-01"
                             # Add duration if available
-                            duration_match = re.search(r'(\d+)[-\s]*nights?', text, re.IGNORECASE)
+                            duration_match = fields.get('nights0')
                             if duration_match:
-                                nights = int(duration_match.group(1))
-                                start_dt = datetime(int(year), int(month_map[month]), 1)
+                                nights = int(duration_match.group('nights0'))
+                                start_dt = datetime(int(year), int(self.month_map[month]), 1)
                                 end_dt = start_dt + timedelta(days=nights)
                                 end_date = end_dt.strftime("%Y-%m-%d")
                         break
         
         return start_date, end_date
     
-    def extract_duration(self, text: str) -> int:
+    def extract_duration(self, text: str, fields: Optional[Dict[str, re.Match]] = None) -> int:
         """Extract Duration (Nights)"""
-        patterns = [
-            r'(\d+)[-\s]*nights?',
-            r'(\d+)[-\s]*nights?[-\s]*/[-\s]*\d+[-\s]*days?',
-            r'(\d+)\s*रातें'
-        ]
+        if fields is None:
+            fields = self.scan_fields(text)
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
+        key, match = self._first_field(fields, 'nights', 3)
+        if match:
+            return int(match.group(key))
         
         return 0
     
-    def extract_hotel_type(self, text: str) -> str:
+    def extract_hotel_type(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Hotel Type"""
-        patterns = [
-            r'hotel\s*category\s*preferred\s*is\s*([^,.\n]*?)(?:[,.\n]|with)',
-            r'preferred\s*hotel\s*is\s*([^,.\n]*?)(?:[,.\n]|with)',
-            r'hotel\s*([^,.\n]*?)(?:[,.\n]|with)'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                hotel_type = match.group(1).strip()
-                if hotel_type and len(hotel_type) > 2:
-                    return hotel_type
+        if 'hotel' in text_lower:
+            for hotel_re in self.hotel_res:
+                match = hotel_re.search(text)
+                if match:
+                    hotel_type = match.group(1).strip()
+                    if hotel_type and len(hotel_type) > 2:
+                        return hotel_type
         
         # Look for specific hotel types
-        text_lower = text.lower()
-        if 'water villa' in text_lower:
-            return 'Water villa'
-        elif '5-star' in text_lower:
-            return '5-star'
-        elif '4-star' in text_lower:
-            return '4-star'
-        elif '3-star' in text_lower:
-            return '3-star'
-        
-        return "Not Specified"
-    
-    def extract_meal_plan(self, text: str) -> str:
+        return self._match_phrase_label('hotel_type', text_lower)
+    
+    def extract_meal_plan(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Meal Plan"""
-        text_lower = text.lower()
-        
-        if 'breakfast only' in text_lower:
-            return "Breakfast only"
-        elif 'breakfast and dinner' in text_lower:
-            return "Breakfast and dinner"
-        elif 'all meals' in text_lower:
-            return "All meals"
-        elif 'veg meals' in text_lower:
-            return "Veg meals"
-        elif 'with breakfast' in text_lower:
-            return "Breakfast"
-        
-        return "Not Specified"
-    
-    def extract_clean_activities(self, text: str) -> str:
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._match_phrase_label('meal_plan', text_lower)
+    
+    def extract_clean_activities(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Planned Activities without duplicates"""
-        activities_set = set()  # Use set to avoid duplicates
-        text_lower = text.lower()
+        activities = {}  # Ordered set: avoids duplicates, deterministic order
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Specific activity extraction patterns
-        activity_patterns = [
-            r'city\s*tour\s*including\s*([^,.]*?)(?:[,.]|and)',
-            r'visit\s*to\s*([^,.]*?)(?:[,.]|in)',
-            r'keen\s*on\s*([^,.]*?)(?:[,.]|they)',
-            r'want\s*to\s*include\s*([^,.]*?)(?:[,.]|flights)',
-            r'they\s*want\s*([^,.]*?)(?:[,.]|flights)',
-            r'include\s*([^,.]*?)(?:[,.]|flights)',
-            r'गतिविधियाँ[:\s]*([^.]*?)(?:\.|flights)'
-        ]
-        
-        for pattern in activity_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for literal, activity_re in self.activity_res:
+            if literal not in text_lower:
+                continue
+            matches = activity_re.findall(text)
             for match in matches:
                 if match.strip() and len(match.strip()) > 3:
                     # Clean the activity text
                     clean_activity = match.strip()
                     # Remove common prefixes
-                    clean_activity = re.sub(r'^(to\s*include\s*|including\s*)', '', clean_activity, flags=re.IGNORECASE)
+                    clean_activity = self.activity_prefix_re.sub('', clean_activity)
                     if clean_activity:
-                        activities_set.add(clean_activity.title())
+                        activities[clean_activity.title()] = None
         
         # Check for specific known activities without duplicating
-        activity_mapping = {
-            'temples': 'Temples visit',
-            'safari world': 'Safari World',
-            'island hopping': 'Island hopping',
-            'phi phi': 'Phi Phi islands',
-            'james bond': 'James Bond islands',
-            'romantic dinner': 'Romantic dinner',
-            'cruise ride': 'Cruise ride',
-            'fort aguada': 'Fort Aguada',
-            'baga beach': 'Baga Beach',
-            'city tour': 'City tour'
-        }
-        
-        for keyword, activity_name in activity_mapping.items():
-            if keyword in text_lower:
-                activities_set.add(activity_name)
-        
-        # Convert set back to list and join
-        activities_list = list(activities_set)
-        return ', '.join(activities_list[:5]) if activities_list else "Not Specified"
+        found = self._find_keywords(self.activity_matcher, text_lower)
+        for keyword, activity_name in self.activity_mapping.items():
+            if keyword in found:
+                activities[activity_name] = None
+        
+        # Keep the first five in the order they were found
+        activities_list = list(activities)
+        return ', '.join(activities_list[:5]) if activities_list else NOT_SPECIFIED
     
-    def extract_flight_required(self, text: str) -> str:
+    def extract_flight_required(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Flight Required"""
-        text_lower = text.lower()
-        
-        if 'flights will be booked separately' in text_lower:
-            return "FALSE"
-        elif 'flights not required' in text_lower:
-            return "FALSE"
-        elif 'flights required' in text_lower:
-            return "TRUE"
-        elif 'flights needed' in text_lower:
-            return "TRUE"
-        
-        return "Not Specified"
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._match_phrase_label('flight_required', text_lower)
     
-    def extract_visa_required(self, text: str) -> str:
+    def extract_visa_required(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Visa Required"""
-        text_lower = text.lower()
-        
-        if 'visa assistance' in text_lower:
-            return "TRUE"
-        elif 'visa required' in text_lower:
-            return "TRUE"
-        elif 'visa not required' in text_lower:
-            return "FALSE"
-        
-        return "Not Specified"
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._match_phrase_label('visa_required', text_lower)
     
-    def extract_budget(self, text: str) -> str:
+    def extract_budget(self, text: str, fields: Optional[Dict[str, re.Match]] = None) -> str:
         """Extract Budget - only include 'per person' if mentioned in message"""
-        patterns = [
-            r'budget\s*is\s*approximately\s*[₹Rs\.]*\s*(\d+(?:,\d+)*)\s*(per\s*person)?',
-            r'approximately\s*[₹Rs\.]*\s*(\d+(?:,\d+)*)\s*(per\s*person)?',
-            r'around\s*[₹Rs\.]*\s*(\d+(?:,\d+)*)\s*(per\s*person)?',
-            r'[₹Rs\.]\s*(\d+(?:,\d+)*)\s*(per\s*person)?',
-            r'budget[:\s]*[₹Rs\.]*\s*(\d+(?:,\d+)*)\s*(per\s*person)?'
-        ]
+        if fields is None:
+            fields = self.scan_fields(text)
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '')
-                per_person = match.group(2) if len(match.groups()) > 1 and match.group(2) else ""
-                
-                if per_person:
-                    return f"₹{amount} per person"
-                else:
-                    return f"₹{amount}"
+        key, match = self._first_field(fields, 'budget', 5)
+        if match:
+            amount = match.group(key).replace(',', '')
+            per_person = match.group(f'{key}_pp')
+            
+            if per_person:
+                return f"₹{amount} per person"
+            else:
+                return f"₹{amount}"
         
-        return "Not Specified"
+        return NOT_SPECIFIED
     
-    def extract_special_requests(self, text: str) -> str:
+    def extract_special_requests(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Special Requests"""
         requests = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        request_mapping = {
-            'airport transfers': 'Airport transfers',
-            'visa assistance': 'Visa assistance',
-            'indian dinners': 'Indian dinners',
-            'late checkout': 'Late checkout',
-            'early check-in': 'Early check-in',
-            'wheelchair access': 'Wheelchair access',
-            'romantic dinner': 'Romantic dinner',
-            'birthday cake': 'Birthday cake'
-        }
-        
-        for keyword, request_name in request_mapping.items():
+        for keyword, request_name in self.request_mapping.items():
             if keyword in text_lower:
                 requests.append(request_name)
         
-        return ', '.join(requests) if requests else "Not Specified"
+        return ', '.join(requests) if requests else NOT_SPECIFIED
     
-    def extract_deadline(self, text: str) -> str:
+    def extract_deadline(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract Response Deadline"""
-        text_lower = text.lower()
-        
-        if 'client is in hurry' in text_lower or 'hurry to finalize' in text_lower:
-            return "Urgent"
-        elif 'urgent' in text_lower or 'jaldi' in text_lower:
-            return "Urgent"
-        elif 'asap' in text_lower:
-            return "ASAP"
-        elif 'today' in text_lower:
-            return "Today"
-        elif 'tomorrow' in text_lower:
-            return "Tomorrow"
-        elif 'finalize karna chahta hai' in text_lower:
-            return "ASAP"
-        
-        return "Not Specified"
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._match_phrase_label('deadline', text_lower)
     
     def process_single_inquiry(self, file_path: str) -> Dict[str, Any]:
         """Process a single inquiry file with perfect extraction"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read().strip()
+            with open(file_path, 'rb') as file:
+                data = file.read()
+            
+            # UTF-8 never has fewer bytes than characters, so tiny files skip decoding
+            if len(data) < 20:
+                return self._create_empty_result(file_path)
+            
+            text = data.decode('utf-8')
+            if '\r' in text:
+                # Match text-mode universal newlines
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            text = text.strip()
             
             if len(text) < 20:
                 return self._create_empty_result(file_path)
             
-            # Extract all required fields
-            customer_name = self.extract_customer_name(text)
-            total_travelers, adults, children = self.extract_travelers_info(text)
-            destinations = self.extract_destinations(text)
-            start_date, end_date = self.extract_actual_dates(text)
-            duration = self.extract_duration(text)
-            hotel_type = self.extract_hotel_type(text)
-            meal_plan = self.extract_meal_plan(text)
-            activities = self.extract_clean_activities(text)
-            flight_required = self.extract_flight_required(text)
-            visa_required = self.extract_visa_required(text)
-            budget = self.extract_budget(text)
-            special_requests = self.extract_special_requests(text)
-            deadline = self.extract_deadline(text)
+            # Lowercase and scan the fused field patterns once, then extract
+            # all required fields
+            text_lower = text.lower()
+            fields = self.scan_fields(text)
+            customer_name = self.extract_customer_name(text, fields)
+            total_travelers, adults, children = self.extract_travelers_info(text, fields)
+            destinations = self.extract_destinations(text, text_lower)
+            start_date, end_date = self.extract_actual_dates(text, text_lower, fields)
+            duration = self.extract_duration(text, fields)
+            hotel_type = self.extract_hotel_type(text, text_lower)
+            meal_plan = self.extract_meal_plan(text, text_lower)
+            activities = self.extract_clean_activities(text, text_lower)
+            flight_required = self.extract_flight_required(text, text_lower)
+            visa_required = self.extract_visa_required(text, text_lower)
+            budget = self.extract_budget(text, fields)
+            special_requests = self.extract_special_requests(text, text_lower)
+            deadline = self.extract_deadline(text, text_lower)
             
             # Result with exact field order as requested (Customer Name, File Name first)
             result = {
@@ -507,9 +677,9 @@ class PerfectTravelExtractor:
                 'Planned Activities': activities,
                 'Flight Required': flight_required,
                 'Visa Required': visa_required,
-                'Insurance Required': "Not Specified",
+                'Insurance Required': NOT_SPECIFIED,
                 'Budget': budget,  # Renamed as requested
-                'Departure City': "Not Specified",
+                'Departure City': NOT_SPECIFIED,
                 'Special Requests': special_requests,
                 'Response Deadline': deadline
                 # Removed: Processing Status, Guide Language, Contact Info as requested
@@ -522,27 +692,9 @@ class PerfectTravelExtractor:
     
     def _create_empty_result(self, file_path: str) -> Dict[str, Any]:
         """Create empty result with exact field order"""
-        return {
-            'Customer Name': "Not Specified",
-            'File Name': Path(file_path).name,
-            'Number of Travelers': 0,
-            'Number of Adults': 0,
-            'Number of Children': 0,
-            'Destination(s)': "Not Specified",
-            'Start Date': "Not Specified",
-            'End Date': "Not Specified",
-            'Duration (Nights)': 0,
-            'Hotel Type': "Not Specified",
-            'Meal Plan': "Not Specified",
-            'Planned Activities': "Not Specified",
-            'Flight Required': "Not Specified",
-            'Visa Required': "Not Specified",
-            'Insurance Required': "Not Specified",
-            'Budget': "Not Specified",
-            'Departure City': "Not Specified",
-            'Special Requests': "Not Specified",
-            'Response Deadline': "Not Specified"
-        }
+        result = self.EMPTY_RESULT.copy()
+        result['File Name'] = Path(file_path).name
+        return result
     
     def _create_error_result(self, file_path: str, error: str) -> Dict[str, Any]:
         """Create error result"""
@@ -550,29 +702,62 @@ class PerfectTravelExtractor:
         result['Error'] = f'Error: {error}'
         return result
     
+    def _use_process_pool(self, file_sizes: List[int]) -> bool:
+        """Extraction is CPU-bound regex work that holds the GIL, so use processes unless files are tiny"""
+        if not file_sizes:
+            return False
+        return sum(file_sizes) / len(file_sizes) >= self.PROCESS_POOL_MIN_AVG_BYTES
+    
     def process_all_inquiries(self) -> List[Dict[str, Any]]:
         """Process all inquiry files"""
-        inquiry_files = list(Path('inquiries').glob('*.txt'))
-        results = []
+        # Single directory pass; DirEntry carries the stat info for sizing
+        inquiry_files = []
+        file_sizes = []
+        with os.scandir('inquiries') as entries:
+            for entry in entries:
+                if entry.name.endswith('.txt') and not entry.name.startswith('.') and entry.is_file():
+                    inquiry_files.append(entry.path)
+                    file_sizes.append(entry.stat().st_size)
         
         print(f"Processing {len(inquiry_files)} inquiry files...")
         
-        with ThreadPoolExecutor(max_workers=16) as executor:
-            future_to_file = {executor.submit(self.process_single_inquiry, str(file)): file 
-                             for file in inquiry_files}
-            
-            for future in as_completed(future_to_file):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    file_path = future_to_file[future]
-                    results.append(self._create_error_result(str(file_path), str(e)))
+        if self._use_process_pool(file_sizes):
+            workers = os.cpu_count() or 1
+            executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            workers = 16
+            executor = ThreadPoolExecutor(max_workers=workers)
+        
+        # process_single_inquiry never raises; ~4 chunks per worker amortizes
+        # IPC for processes while keeping the load balanced (ignored by threads)
+        chunksize = max(1, len(inquiry_files) // (workers * 4))
+        with executor:
+            results = list(executor.map(self.process_single_inquiry, inquiry_files, chunksize=chunksize))
         
         # Sort by file name
         results.sort(key=lambda x: x['File Name'])
         return results
     
+    def summarize_results(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count all summary metrics in a single pass over the results"""
+        successful = children_specified = actual_dates = activities = budget = 0
+        for r in results:
+            successful += 'Error' not in r
+            children_specified += r.get('Number of Children', 0) > 0
+            start_date = r.get('Start Date', NOT_SPECIFIED)
+            actual_dates += start_date != NOT_SPECIFIED and '2025-07-15' not in str(start_date)
+            activities += r.get('Planned Activities', NOT_SPECIFIED) != NOT_SPECIFIED
+            budget += r.get('Budget', NOT_SPECIFIED) != NOT_SPECIFIED
+        
+        return {
+            'total': len(results),
+            'successful': successful,
+            'children_specified': children_specified,
+            'actual_dates': actual_dates,
+            'activities': activities,
+            'budget': budget
+        }
+    
     def generate_perfect_excel(self, results: List[Dict[str, Any]], output_path: str) -> str:
         """Generate perfect Excel report with exact formatting"""
         
@@ -585,39 +770,41 @@ class PerfectTravelExtractor:
             'Departure City', 'Special Requests', 'Response Deadline'
         ]
         
-        # Create DataFrame with exact column order
-        df = pd.DataFrame(results)
-        df = df.reindex(columns=column_order)
+        # Stream rows straight into a write-only workbook (no DataFrame or
+        # per-cell object graph); missing fields become empty cells and extra
+        # keys such as 'Error' are dropped, as the old reindex did
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Travel Inquiries')
+        worksheet.append(column_order)
+        for result in results:
+            worksheet.append(list(map(result.get, column_order)))
+        
+        # Summary sheet
+        counts = self.summarize_results(results)
+        summary_data = {
+            'Metric': [
+                'Total Files Processed',
+                'Successfully Processed', 
+                'Files with Children Data',
+                'Files with Actual Start Dates',
+                'Files with Activities',
+                'Files with Budget Info'
+            ],
+            'Value': [
+                counts['total'],
+                counts['successful'],
+                counts['children_specified'],
+                counts['actual_dates'],
+                counts['activities'],
+                counts['budget']
+            ]
+        }
+        summary_sheet = workbook.create_sheet('Summary')
+        summary_sheet.append(list(summary_data))
+        for row in zip(*summary_data.values()):
+            summary_sheet.append(list(row))
         
-        # Save to Excel
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Travel Inquiries', index=False)
-            
-            # Summary sheet
-            successful = len([r for r in results if 'Error' not in r])
-            children_specified = len([r for r in results if r.get('Number of Children', 0) > 0])
-            actual_dates = len([r for r in results if r.get('Start Date', 'Not Specified') != 'Not Specified' and '2025-07-15' not in str(r.get('Start Date', ''))])
-            
-            summary_data = {
-                'Metric': [
-                    'Total Files Processed',
-                    'Successfully Processed', 
-                    'Files with Children Data',
-                    'Files with Actual Start Dates',
-                    'Files with Activities',
-                    'Files with Budget Info'
-                ],
-                'Value': [
-                    len(results),
-                    successful,
-                    children_specified,
-                    actual_dates,
-                    len([r for r in results if r.get('Planned Activities', 'Not Specified') != 'Not Specified']),
-                    len([r for r in results if r.get('Budget', 'Not Specified') != 'Not Specified'])
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        workbook.save(output_path)
         
         return output_path
 
@@ -638,13 +825,12 @@ def main():
     extractor.generate_perfect_excel(results, output_path)
     
     # Print summary
-    successful = len([r for r in results if 'Error' not in r])
-    children_specified = len([r for r in results if r.get('Number of Children', 0) > 0])
+    counts = extractor.summarize_results(results)
     
     print(f"Processing completed in {total_time:.2f} seconds")
-    print(f"Total Files: {len(results)}")
-    print(f"Successful: {successful}")
-    print(f"Files with Children Data: {children_specified}")
+    print(f"Total Files: {counts['total']}")
+    print(f"Successful: {counts['successful']}")
+    print(f"Files with Children Data: {counts['children_specified']}")
     print(f"Perfect Excel report: {output_path}")
     
     # Verify Thailand sample
@@ -3,9 +3,18 @@ Main Processing Pipeline
 Orchestrates the entire inquiry processing workflow
 """
 
+import copy
+import datetime
+import hashlib
+import json
+import numbers
+import operator
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
-from pathlib import Path
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from config import Config
 from utils.logger import setup_logger
@@ -14,21 +23,126 @@ from modules.ml_extractor import MLExtractor
 from modules.rule_extractor import RuleExtractor
 from modules.fusion_engine import FusionEngine
 
+try:
+    import orjson  # optional: C JSON encoder
+except ImportError:
+    orjson = None
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert values JSON has no type for; shared by the orjson and json paths
+    
+    Numbers stay numbers (e.g. numpy.float64, which orjson would otherwise
+    hand to this hook as a float subclass), dates use ISO 8601 as orjson
+    does natively, arrays become lists, and anything else is written as str.
+    """
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    tolist = getattr(value, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    return str(value)
+
+# Per-worker processor for process_inquiries_parallel; models are loaded once per process
+_worker_processor = None
+
+def _init_worker():
+    """Process pool initializer: build this worker's InquiryProcessor"""
+    global _worker_processor
+    _worker_processor = InquiryProcessor()
+
+def _worker_process(payload: Tuple[str, str]) -> Dict[str, Any]:
+    """Process one (text_content, file_path) payload in a pool worker"""
+    text_content, file_path = payload
+    return _worker_processor.process_inquiry(text_content, file_path)
+
 class InquiryProcessor:
     """Main processor that orchestrates the entire inquiry processing pipeline"""
     
+    # Timed pipeline stages: pipeline_stats key -> log label
+    PIPELINE_STAGES = {
+        'preprocessing_time': 'Preprocessing',
+        'ml_extraction_time': 'ML extraction',
+        'rule_extraction_time': 'Rule-based extraction',
+        'fusion_time': 'Fusion'
+    }
+    
+    # Keys every processing result must carry (see validate_processing_result)
+    REQUIRED_RESULT_FIELDS = frozenset({
+        'file_path', 'customer_name', 'travel_dates', 'destination',
+        'budget', 'travelers_count', 'contact_info', 'special_requirements',
+        'status', 'processing_time', 'confidence_score'
+    })
+    
     def __init__(self):
         self.config = Config()
         self.logger = setup_logger('inquiry_processor')
         
-        # Initialize all processing modules
-        self.text_preprocessor = TextPreprocessor()
-        self.ml_extractor = MLExtractor()
-        self.rule_extractor = RuleExtractor()
-        self.fusion_engine = FusionEngine()
+        # Processing modules are created on first use (see the properties
+        # below), so constructing a processor does not load any models.
+        # The lock makes sure threads sharing this processor build each one once.
+        self._text_preprocessor: Optional[TextPreprocessor] = None
+        self._ml_extractor: Optional[MLExtractor] = None
+        self._rule_extractor: Optional[RuleExtractor] = None
+        self._fusion_engine: Optional[FusionEngine] = None
+        self._component_lock = threading.Lock()
+        
+        # LRU of successful results keyed by a digest of the raw inquiry text
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()  # shared by main.py's worker threads
+        
+        # Component health, computed by the first health_check() (see refresh_health)
+        self._health_cache: Optional[Dict[str, bool]] = None
         
         self.logger.info("Inquiry processor initialized successfully")
     
+    @property
+    def text_preprocessor(self) -> TextPreprocessor:
+        """Text preprocessing module, created on first use"""
+        return self._component('_text_preprocessor', TextPreprocessor)
+    
+    @property
+    def ml_extractor(self) -> MLExtractor:
+        """ML-based entity extractor, created on first use (loads the NER model)"""
+        return self._component('_ml_extractor', MLExtractor)
+    
+    @property
+    def rule_extractor(self) -> RuleExtractor:
+        """Rule-based entity extractor, created on first use"""
+        return self._component('_rule_extractor', RuleExtractor)
+    
+    @property
+    def fusion_engine(self) -> FusionEngine:
+        """Fusion engine, created on first use"""
+        return self._component('_fusion_engine', FusionEngine)
+    
+    def _component(self, attr: str, factory):
+        """
+        Return a lazily built processing module, building it at most once
+        
+        Double-checked: the common path is a plain attribute read, and only
+        the first callers take the lock (the others wait for the one build).
+        
+        Args:
+            attr: Instance attribute holding the module
+            factory: Class to instantiate on first use
+            
+        Returns:
+            The processing module
+        """
+        component = getattr(self, attr)
+        if component is None:
+            with self._component_lock:
+                component = getattr(self, attr)
+                if component is None:
+                    component = factory()
+                    setattr(self, attr, component)
+        return component
+    
     def process_inquiry(self, text_content: str, file_path: str) -> Dict[str, Any]:
         """
         Process a single customer inquiry through the complete pipeline
@@ -40,90 +154,311 @@ class InquiryProcessor:
         Returns:
             Dictionary containing extracted information and metadata
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        stage_times: Dict[str, float] = {}  # Filled by _run_stage, kept on failure too
         
         try:
             self.logger.debug(f"Starting processing pipeline for: {file_path}")
             
+            # Identical inquiry text (forwarded emails, agency templates) reuses the cached result
+            cache_key = self._cache_key(text_content)
+            cached_result = self._get_cached_result(cache_key, file_path, start_ns)
+            if cached_result is not None:
+                return cached_result
+            
             # Step 1: Text Preprocessing
-            preprocessing_start = time.time()
-            preprocessed_data = self.text_preprocessor.preprocess_inquiry(text_content)
+            preprocessed_data = self._run_stage('preprocessing_time', stage_times,
+                                                self.text_preprocessor.preprocess_inquiry, text_content)
             
             if preprocessed_data['status'] != 'SUCCESS':
                 self.logger.warning(f"Preprocessing failed for {file_path}: {preprocessed_data['status']}")
-                return self._create_failed_result(file_path, preprocessed_data['status'], start_time)
-            
-            preprocessing_time = time.time() - preprocessing_start
-            self.logger.debug(f"Preprocessing completed in {preprocessing_time:.3f}s")
+                return self._create_failed_result(file_path, preprocessed_data['status'], start_ns, stage_times)
             
             # Step 2: ML-based Entity Extraction
-            ml_start = time.time()
-            ml_results = self.ml_extractor.extract_all_entities(preprocessed_data['ner_text'])
-            ml_time = time.time() - ml_start
-            self.logger.debug(f"ML extraction completed in {ml_time:.3f}s")
+            ml_results = self._run_stage('ml_extraction_time', stage_times,
+                                         self.ml_extractor.extract_all_entities, preprocessed_data['ner_text'])
             
             # Step 3: Rule-based Entity Extraction
-            rule_start = time.time()
-            rule_results = self.rule_extractor.extract_all_entities(preprocessed_data['rules_text'])
-            rule_time = time.time() - rule_start
-            self.logger.debug(f"Rule-based extraction completed in {rule_time:.3f}s")
+            rule_results = self._run_stage('rule_extraction_time', stage_times,
+                                           self.rule_extractor.extract_all_entities, preprocessed_data['rules_text'])
             
             # Step 4: Fusion of Results
-            fusion_start = time.time()
-            fused_results = self.fusion_engine.fuse_extractions(ml_results, rule_results)
-            fusion_time = time.time() - fusion_start
-            self.logger.debug(f"Fusion completed in {fusion_time:.3f}s")
+            fused_results = self._run_stage('fusion_time', stage_times,
+                                            self.fusion_engine.fuse_extractions, ml_results, rule_results)
             
             # Step 5: Create Final Result
-            total_processing_time = time.time() - start_time
-            
-            final_result = {
-                'file_path': file_path,
-                'customer_name': fused_results['customer_name'],
-                'travel_dates': fused_results['travel_dates'],
-                'destination': fused_results['destination'],
-                'budget': fused_results['budget'],
-                'travelers_count': fused_results['travelers_count'],
-                'contact_info': fused_results['contact_info'],
-                'special_requirements': fused_results['special_requirements'],
-                'status': 'SUCCESS',
-                'processing_time': total_processing_time,
-                'confidence_score': fused_results['confidence_score'],
-                'extraction_methods': fused_results['extraction_methods'],
-                'pipeline_stats': {
-                    'preprocessing_time': preprocessing_time,
-                    'ml_extraction_time': ml_time,
-                    'rule_extraction_time': rule_time,
-                    'fusion_time': fusion_time,
-                    'total_time': total_processing_time
-                },
-                'text_stats': preprocessed_data['stats'],
-                'language_info': preprocessed_data['languages']
-            }
+            total_processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            
+            final_result = self._create_success_result(file_path, preprocessed_data, fused_results,
+                                                       self._pipeline_stats(stage_times, total_processing_time))
             
-            self.logger.info(f"Successfully processed {Path(file_path).name} in {total_processing_time:.3f}s")
+            self._store_cached_result(cache_key, final_result)
+            
+            self.logger.info(f"Successfully processed {os.path.basename(file_path)} in {total_processing_time:.3f}s")
             return final_result
             
         except Exception as e:
-            processing_time = time.time() - start_time
             error_msg = f"Processing pipeline error: {str(e)}"
             self.logger.error(f"Error processing {file_path}: {error_msg}")
             
-            return self._create_failed_result(file_path, f"ERROR: {error_msg}", start_time)
+            return self._create_failed_result(file_path, f"ERROR: {error_msg}", start_ns, stage_times)
     
-    def _create_failed_result(self, file_path: str, error_status: str, start_time: float) -> Dict[str, Any]:
+    def _run_stage(self, stage: str, stage_times: Dict[str, float], fn, *args):
+        """
+        Run one pipeline stage, recording its duration in seconds
+        
+        Timings go into the caller's dict rather than onto self, since one
+        processor may serve several threads at once.
+        
+        Args:
+            stage: pipeline_stats key of the stage (see PIPELINE_STAGES)
+            stage_times: Per-inquiry stage timings to update
+            fn: Stage callable
+            *args: Arguments for fn
+            
+        Returns:
+            Whatever fn returns
+        """
+        stage_start = time.perf_counter_ns()
+        output = fn(*args)
+        elapsed = (time.perf_counter_ns() - stage_start) * 1e-9
+        stage_times[stage] = elapsed
+        self.logger.debug(f"{self.PIPELINE_STAGES[stage]} completed in {elapsed:.3f}s")
+        return output
+    
+    def _pipeline_stats(self, stage_times: Dict[str, float], total_time: float) -> Dict[str, float]:
+        """pipeline_stats dict from recorded stage timings (stages that did not run count as 0.0)"""
+        pipeline_stats = {stage: stage_times.get(stage, 0.0) for stage in self.PIPELINE_STAGES}
+        pipeline_stats['total_time'] = total_time
+        return pipeline_stats
+    
+    def process_inquiries_batch(self, texts: List[str], file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process many inquiries with batched ML and rule-based extraction
+        
+        Every inquiry is preprocessed first, then the spaCy stages run once
+        over the whole batch (nlp.pipe) before fusion runs per inquiry.
+        Batched stage times are attributed to each inquiry in proportion to
+        the length of its text.
+        
+        Args:
+            texts: Raw text content of each inquiry
+            file_paths: Path to the source file of each inquiry
+            
+        Returns:
+            List of result dictionaries, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        prepared = []  # (index, preprocessed_data, preprocessing_time, start_ns)
+        
+        cache_keys = {}  # index -> result cache key, for inquiries that go through the pipeline
+        
+        # Step 1: Text Preprocessing
+        for index, (text_content, file_path) in enumerate(zip(texts, file_paths)):
+            start_ns = time.perf_counter_ns()
+            try:
+                cache_key = self._cache_key(text_content)
+                cached_result = self._get_cached_result(cache_key, file_path, start_ns)
+                if cached_result is not None:
+                    results[index] = cached_result
+                    continue
+                cache_keys[index] = cache_key
+                
+                preprocessed_data = self.text_preprocessor.preprocess_inquiry(text_content)
+            except Exception as e:
+                error_msg = f"Processing pipeline error: {str(e)}"
+                self.logger.error(f"Error processing {file_path}: {error_msg}")
+                results[index] = self._create_failed_result(file_path, f"ERROR: {error_msg}", start_ns)
+                continue
+            
+            if preprocessed_data['status'] != 'SUCCESS':
+                self.logger.warning(f"Preprocessing failed for {file_path}: {preprocessed_data['status']}")
+                results[index] = self._create_failed_result(file_path, preprocessed_data['status'], start_ns)
+                continue
+            
+            prepared.append((index, preprocessed_data, (time.perf_counter_ns() - start_ns) * 1e-9, start_ns))
+        
+        if not prepared:
+            return results
+        
+        try:
+            # Steps 2 and 3: ML and rule-based extraction, one batch each
+            ner_texts = [data['ner_text'] for _, data, _, _ in prepared]
+            rules_texts = [data['rules_text'] for _, data, _, _ in prepared]
+            
+            ml_start_ns = time.perf_counter_ns()
+            ml_batch = self.ml_extractor.extract_all_entities_batch(ner_texts, batch_size=self.config.BATCH_SIZE)
+            ml_ns = time.perf_counter_ns()
+            rule_batch = self.rule_extractor.extract_all_entities_batch(rules_texts, batch_size=self.config.BATCH_SIZE)
+            rule_ns = time.perf_counter_ns()
+            ml_time = (ml_ns - ml_start_ns) * 1e-9
+            rule_time = (rule_ns - ml_ns) * 1e-9
+            
+            self.logger.debug(f"Batched extraction of {len(prepared)} inquiries: ML {ml_time:.3f}s, rules {rule_time:.3f}s")
+        except Exception as e:
+            error_msg = f"Processing pipeline error: {str(e)}"
+            self.logger.error(f"Batched extraction error: {error_msg}")
+            for index, _, _, start_ns in prepared:
+                results[index] = self._create_failed_result(file_paths[index], f"ERROR: {error_msg}", start_ns)
+            return results
+        
+        ner_chars = sum(len(text) for text in ner_texts) or 1
+        rules_chars = sum(len(text) for text in rules_texts) or 1
+        
+        # Step 4 and 5: Fusion and final result, per inquiry
+        for (index, preprocessed_data, preprocessing_time, start_ns), ner_text, rules_text, ml_results, rule_results in zip(
+                prepared, ner_texts, rules_texts, ml_batch, rule_batch):
+            file_path = file_paths[index]
+            try:
+                fusion_start_ns = time.perf_counter_ns()
+                fused_results = self.fusion_engine.fuse_extractions(ml_results, rule_results)
+                fusion_time = (time.perf_counter_ns() - fusion_start_ns) * 1e-9
+                
+                item_ml_time = ml_time * len(ner_text) / ner_chars
+                item_rule_time = rule_time * len(rules_text) / rules_chars
+                total_processing_time = preprocessing_time + item_ml_time + item_rule_time + fusion_time
+                
+                results[index] = self._create_success_result(file_path, preprocessed_data, fused_results, self._pipeline_stats({
+                    'preprocessing_time': preprocessing_time,
+                    'ml_extraction_time': item_ml_time,
+                    'rule_extraction_time': item_rule_time,
+                    'fusion_time': fusion_time
+                }, total_processing_time))
+                self._store_cached_result(cache_keys[index], results[index])
+                
+                self.logger.info(f"Successfully processed {os.path.basename(file_path)} in {total_processing_time:.3f}s")
+                
+            except Exception as e:
+                error_msg = f"Processing pipeline error: {str(e)}"
+                self.logger.error(f"Error processing {file_path}: {error_msg}")
+                results[index] = self._create_failed_result(file_path, f"ERROR: {error_msg}", start_ns)
+        
+        return results
+    
+    def process_inquiries_parallel(self, file_texts: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process many inquiries across a pool of worker processes
+        
+        Each worker builds its own InquiryProcessor once (see _init_worker),
+        so models are not reloaded per inquiry. Inquiries are dispatched
+        smallest first, like optimize_processing_order, so the large ones
+        do not all land at the tail.
+        
+        Args:
+            file_texts: (text_content, file_path) pairs
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of result dictionaries, in input order
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(file_texts) <= 1:
+            return [self.process_inquiry(text_content, file_path) for text_content, file_path in file_texts]
+        
+        order = sorted(range(len(file_texts)), key=lambda i: len(file_texts[i][0]))
+        payloads = [file_texts[i] for i in order]
+        chunksize = max(1, len(payloads) // (workers * 4))
+        
+        self.logger.info(f"Processing {len(payloads)} inquiries with {workers} worker processes")
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_texts)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            for index, result in zip(order, executor.map(_worker_process, payloads, chunksize=chunksize)):
+                results[index] = result
+        
+        return results
+    
+    def _cache_key(self, text_content: str) -> bytes:
+        """Digest of the raw inquiry text used as the result cache key"""
+        return hashlib.blake2b(text_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    
+    def _get_cached_result(self, cache_key: bytes, file_path: str, start_ns: int) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached result for an identical inquiry, if any
+        
+        Args:
+            cache_key: Digest from _cache_key
+            file_path: Path to the source file of this inquiry
+            start_ns: Processing start time from time.perf_counter_ns()
+            
+        Returns:
+            Result dictionary for file_path, or None on a cache miss
+        """
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+        
+        # Cached entries are never mutated, so the copy can happen outside the lock
+        result = copy.deepcopy(cached)
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
+        result['file_path'] = file_path
+        result['processing_time'] = processing_time
+        result['pipeline_stats'] = self._pipeline_stats({}, processing_time)
+        
+        self.logger.info(f"Reused cached result for {os.path.basename(file_path)}")
+        return result
+    
+    def _store_cached_result(self, cache_key: bytes, result: Dict[str, Any]):
+        """Cache a successful result, evicting the least recently used one when full"""
+        if self.config.RESULT_CACHE_SIZE <= 0:
+            return
+        
+        cached = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = cached
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self.config.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _create_success_result(self, file_path: str, preprocessed_data: Dict[str, Any],
+                               fused_results: Dict[str, Any], pipeline_stats: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Create the result structure for a successfully processed inquiry
+        
+        Args:
+            file_path: Path to the source file
+            preprocessed_data: Output of the text preprocessor
+            fused_results: Output of the fusion engine
+            pipeline_stats: Per-stage timings, including 'total_time'
+            
+        Returns:
+            Final result dictionary
+        """
+        return {
+            'file_path': file_path,
+            'customer_name': fused_results['customer_name'],
+            'travel_dates': fused_results['travel_dates'],
+            'destination': fused_results['destination'],
+            'budget': fused_results['budget'],
+            'travelers_count': fused_results['travelers_count'],
+            'contact_info': fused_results['contact_info'],
+            'special_requirements': fused_results['special_requirements'],
+            'status': 'SUCCESS',
+            'processing_time': pipeline_stats['total_time'],
+            'confidence_score': fused_results['confidence_score'],
+            'extraction_methods': fused_results['extraction_methods'],
+            'pipeline_stats': pipeline_stats,
+            'text_stats': preprocessed_data['stats'],
+            'language_info': preprocessed_data['languages']
+        }
+    
+    def _create_failed_result(self, file_path: str, error_status: str, start_ns: int,
+                              stage_times: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Create a result structure for failed processing
         
         Args:
             file_path: Path to the source file
             error_status: Error status message
-            start_time: Processing start time
+            start_ns: Processing start time from time.perf_counter_ns()
+            stage_times: Timings of the stages that ran before the failure
             
         Returns:
             Failed result dictionary
         """
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
         return {
             'file_path': file_path,
@@ -145,17 +480,31 @@ class InquiryProcessor:
                 'travelers_count': 'NONE',
                 'contact_info': 'NONE'
             },
-            'pipeline_stats': {
-                'preprocessing_time': 0.0,
-                'ml_extraction_time': 0.0,
-                'rule_extraction_time': 0.0,
-                'fusion_time': 0.0,
-                'total_time': processing_time
-            },
+            'pipeline_stats': self._pipeline_stats(stage_times or {}, processing_time),
             'text_stats': {'char_count': 0, 'word_count': 0, 'sentence_count': 0, 'line_count': 0},
             'language_info': {'english': False, 'hindi': False, 'hinglish': False}
         }
     
+    def serialize_result(self, result: Dict[str, Any]) -> bytes:
+        """
+        Serialize a processing result (or stats dict) to UTF-8 JSON
+        
+        Uses orjson when installed and falls back to the json module; both
+        write compact JSON and convert unknown values with _json_default
+        (numbers stay numbers, Path and other objects become strings).
+        
+        Args:
+            result: Processing result to serialize
+            
+        Returns:
+            JSON document as bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(result, default=_json_default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(result, default=_json_default, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+    
     def validate_processing_result(self, result: Dict[str, Any]) -> bool:
         """
         Validate that a processing result has the expected structure
@@ -166,18 +515,12 @@ class InquiryProcessor:
         Returns:
             True if result is valid, False otherwise
         """
-        required_fields = [
-            'file_path', 'customer_name', 'travel_dates', 'destination',
-            'budget', 'travelers_count', 'contact_info', 'special_requirements',
-            'status', 'processing_time', 'confidence_score'
-        ]
-        
         try:
-            # Check required fields
-            for field in required_fields:
-                if field not in result:
-                    self.logger.error(f"Missing required field in result: {field}")
-                    return False
+            # Check required fields (one set difference against the result keys)
+            missing = self.REQUIRED_RESULT_FIELDS.difference(result)
+            if missing:
+                self.logger.error(f"Missing required field in result: {', '.join(sorted(missing))}")
+                return False
             
             # Check data types
             if not isinstance(result['processing_time'], (int, float)):
@@ -212,44 +555,51 @@ class InquiryProcessor:
             return {}
         
         try:
-            # Basic counts
+            # Single pass: counts, time and confidence extremes, language and
+            # extraction method tallies
             total_files = len(results)
-            successful = sum(1 for r in results if r['status'] == 'SUCCESS')
-            failed = total_files - successful
-            
-            # Time statistics
-            processing_times = [r['processing_time'] for r in results]
-            total_time = sum(processing_times)
-            avg_time = total_time / total_files
-            min_time = min(processing_times)
-            max_time = max(processing_times)
-            
-            # Confidence statistics (only for successful results)
-            successful_results = [r for r in results if r['status'] == 'SUCCESS']
-            if successful_results:
-                confidence_scores = [r['confidence_score'] for r in successful_results]
-                avg_confidence = sum(confidence_scores) / len(confidence_scores)
-                min_confidence = min(confidence_scores)
-                max_confidence = max(confidence_scores)
-            else:
-                avg_confidence = min_confidence = max_confidence = 0.0
-            
-            # Language distribution
+            successful = 0
+            total_time = 0.0
+            min_time = max_time = results[0]['processing_time']
+            confidence_total = 0.0
+            min_confidence = max_confidence = None
             language_counts = {'english': 0, 'hindi': 0, 'hinglish': 0}
+            method_counts = Counter()
+            
             for result in results:
+                processing_time = result['processing_time']
+                total_time += processing_time
+                if processing_time < min_time:
+                    min_time = processing_time
+                if processing_time > max_time:
+                    max_time = processing_time
+                
+                # Language distribution
                 lang_info = result.get('language_info', {})
                 for lang in language_counts:
                     if lang_info.get(lang, False):
                         language_counts[lang] += 1
+                
+                if result['status'] != 'SUCCESS':
+                    continue
+                
+                # Confidence and extraction methods (only for successful results)
+                successful += 1
+                confidence = result['confidence_score']
+                confidence_total += confidence
+                if min_confidence is None or confidence < min_confidence:
+                    min_confidence = confidence
+                if max_confidence is None or confidence > max_confidence:
+                    max_confidence = confidence
+                
+                method_counts.update(result.get('extraction_methods', {}).values())
             
-            # Extraction method statistics
-            method_counts = {}
-            for result in successful_results:
-                methods = result.get('extraction_methods', {})
-                for entity_type, method in methods.items():
-                    if method not in method_counts:
-                        method_counts[method] = 0
-                    method_counts[method] += 1
+            failed = total_files - successful
+            avg_time = total_time / total_files
+            if successful:
+                avg_confidence = confidence_total / successful
+            else:
+                avg_confidence = min_confidence = max_confidence = 0.0
             
             stats = {
                 'total_files': total_files,
@@ -268,7 +618,7 @@ class InquiryProcessor:
                     'maximum': max_confidence
                 },
                 'language_distribution': language_counts,
-                'extraction_methods': method_counts,
+                'extraction_methods': dict(method_counts),
                 'performance_metrics': {
                     'files_per_second': total_files / total_time if total_time > 0 else 0,
                     'meets_target': total_time <= self.config.TARGET_PROCESSING_TIME
@@ -292,19 +642,18 @@ class InquiryProcessor:
             Optimized list of file paths
         """
         try:
-            # Get file sizes
+            # Get file sizes (unreadable files sort first with size 0)
             file_info = []
             for file_path in file_paths:
                 try:
-                    size = Path(file_path).stat().st_size
-                    file_info.append((file_path, size))
-                except:
+                    file_info.append((file_path, os.stat(file_path).st_size))
+                except OSError:
                     file_info.append((file_path, 0))
             
             # Sort by size (process smaller files first for better parallel utilization)
-            file_info.sort(key=lambda x: x[1])
+            file_info.sort(key=operator.itemgetter(1))
             
-            optimized_paths = [info[0] for info in file_info]
+            optimized_paths = [file_path for file_path, _ in file_info]
             
             self.logger.debug(f"Optimized processing order for {len(optimized_paths)} files")
             return optimized_paths
@@ -314,6 +663,30 @@ class InquiryProcessor:
             return file_paths  # Return original order if optimization fails
     
     def health_check(self) -> Dict[str, bool]:
+        """
+        Return the health of all pipeline components
+        
+        The components are exercised once and the outcome is cached; call
+        refresh_health() to run the checks again.
+        
+        Returns:
+            Dictionary with health status of each component
+        """
+        if self._health_cache is None:
+            self._health_cache = self._compute_health()
+        return dict(self._health_cache)
+    
+    def refresh_health(self) -> Dict[str, bool]:
+        """
+        Discard the cached health status and run the health checks again
+        
+        Returns:
+            Dictionary with health status of each component
+        """
+        self._health_cache = None
+        return self.health_check()
+    
+    def _compute_health(self) -> Dict[str, bool]:
         """
         Perform health check on all pipeline components
         
@@ -2,12 +2,17 @@
 Schema definition for AI Travel Agent
 """
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TripInquiry(BaseModel):
     """Pydantic model for validating and formatting trip inquiry data"""
     
+    model_config = ConfigDict(
+        extra="forbid",  # Forbid extra fields
+        validate_assignment=True  # Validate on assignment
+    )
+    
     num_travelers: Optional[int] = Field(None, description="Total number of travelers")
     num_adults: Optional[int] = Field(None, description="Number of adult travelers")
     num_children: Optional[int] = Field(None, description="Number of child travelers")
@@ -33,9 +38,4 @@ class TripInquiry(BaseModel):
     file_name: Optional[str] = Field(None, description="Source file name")
     processing_status: Optional[str] = Field(None, description="Processing status")
     processing_time: Optional[float] = Field(None, description="Processing time in seconds")
-    extraction_method: Optional[str] = Field(None, description="Primary extraction method used")
-    
-    class Config:
-        """Pydantic configuration"""
-        extra = "forbid"  # Forbid extra fields
-        validate_assignment = True  # Validate on assignment
\ No newline at end of file
+    extraction_method: Optional[str] = Field(None, description="Primary extraction method used")
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+Pytest configuration for AI Travel Agent tests
+"""
+
+import sys
+from pathlib import Path
+
+# Modules import each other from the project root (e.g. `from config import Config`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,26 @@
+"""
+Tests for FileHandler encoding detection
+"""
+
+from utils.file_handler import FileHandler
+
+INQUIRY_TEXT = "Hello customer inquiry, I want to plan a trip to Goa for 2 people in December."
+
+
+def test_sniff_encoding_leaves_nul_ascii_to_detector():
+    """BOM-less UTF-16 in the ASCII range is all bytes < 0x80, but is not UTF-8"""
+    handler = FileHandler()
+
+    assert handler._sniff_encoding(INQUIRY_TEXT.encode('ascii')) == 'utf-8'
+    assert handler._sniff_encoding(INQUIRY_TEXT.encode('utf-16-le')) is None
+
+
+def test_read_utf16_without_bom(tmp_path):
+    """A BOM-less UTF-16-LE file decodes to its text, not NUL-interleaved UTF-8"""
+    file_path = tmp_path / "inquiry_utf16.txt"
+    file_path.write_bytes(INQUIRY_TEXT.encode('utf-16-le'))
+
+    handler = FileHandler()
+
+    assert handler.detect_encoding(str(file_path)).lower().replace('_', '-') == 'utf-16-le'
+    assert handler.read_text_file(str(file_path)) == INQUIRY_TEXT
@@ -1,15 +1,28 @@
 """
 Data Processing Utilities for AI Travel Agent
 Handles conversion of bulk data files into individual inquiry files
+(or one JSON Lines manifest per language)
 """
+import json
+import mmap
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 
+try:
+    import orjson  # optional: C JSON encoder/decoder
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Inquiries in every bulk file are separated by a line containing only ---
+_SECTION_SEPARATOR = '\n---\n'
+_SECTION_SEPARATOR_BYTES = _SECTION_SEPARATOR.encode('utf-8')
+_MIN_SECTION_LEN = 50  # Sections this short or shorter are not inquiries
+
 
 class DataProcessor:
     """Processes bulk inquiry data files into individual inquiry files"""
@@ -32,33 +45,18 @@ class DataProcessor:
         inquiries = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Split by separator patterns
-            if language == 'hindi':
-                # Hindi emails separated by ---
-                sections = re.split(r'\n---\n', content)
-            elif language == 'english':
-                # English emails separated by ---
-                sections = re.split(r'\n---\n', content)
-            elif language == 'hinglish':
-                # Hinglish emails separated by ---
-                sections = re.split(r'\n---\n', content)
-            elif language == 'hindi_english':
-                # Hindi-English mix emails separated by ---
-                sections = re.split(r'\n---\n', content)
-            else:
-                sections = re.split(r'\n---\n', content)
-            
-            for i, section in enumerate(sections):
+            # Collected locally and published only once the whole file has
+            # decoded, so a bad byte anywhere yields [] rather than a prefix
+            found = []
+            for i, section in self._iter_sections(file_path):
                 section = section.strip()
-                if section and len(section) > 50:  # Filter out very short sections
-                    inquiries.append({
+                if len(section) > _MIN_SECTION_LEN:  # Filter out very short sections
+                    found.append({
                         'content': section,
                         'language': language,
                         'sequence': i + 1
                     })
+            inquiries = found
                     
             logger.info(f"Extracted {len(inquiries)} inquiries from {file_path}")
             
@@ -67,6 +65,47 @@ class DataProcessor:
             
         return inquiries
     
+    def _iter_sections(self, file_path: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (index, text) for each ---separated section of a bulk file
+        
+        The file is memory-mapped and scanned for the separator bytes, and
+        only sections long enough to pass the length filter are yielded
+        (UTF-8 never has fewer bytes than characters). Skipped sections are
+        still decoded, so invalid UTF-8 anywhere in the file raises
+        UnicodeDecodeError, as decoding the whole file would. Indexes count
+        every section, including the skipped ones.
+        
+        Args:
+            file_path: Path to the bulk file
+            
+        Returns:
+            Iterator of (section index, section text) pairs
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap cannot map an empty file
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'\r') != -1:
+                    # Needs universal-newline translation: decode as a whole
+                    content = mm[:].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                    yield from enumerate(content.split(_SECTION_SEPARATOR))
+                    return
+                
+                start = 0
+                index = 0
+                while True:
+                    end = mm.find(_SECTION_SEPARATOR_BYTES, start)
+                    stop = end if end != -1 else len(mm)
+                    section = mm[start:stop].decode('utf-8')  # Validates skipped sections too
+                    if stop - start > _MIN_SECTION_LEN:
+                        yield index, section
+                    if end == -1:
+                        break
+                    start = end + len(_SECTION_SEPARATOR_BYTES)
+                    index += 1
+    
     def create_individual_files(self, inquiries: List[Dict[str, Any]], language: str) -> List[str]:
         """
         Create individual inquiry files from extracted data
@@ -78,31 +117,136 @@ class DataProcessor:
         Returns:
             List of created file paths
         """
-        created_files = []
+        # Create filename with language prefix and sequence number
+        jobs = [
+            (self.sample_data_dir / f"{language}_{inquiry['sequence']:03d}.txt", inquiry['content'])
+            for inquiry in inquiries
+        ]
         
-        for inquiry in inquiries:
-            # Create filename with language prefix and sequence number
-            filename = f"{language}_{inquiry['sequence']:03d}.txt"
-            file_path = self.sample_data_dir / filename
-            
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(inquiry['content'])
-                
-                created_files.append(str(file_path))
-                
-            except Exception as e:
-                logger.error(f"Error creating file {file_path}: {str(e)}")
+        # Writes release the GIL, so small files are written concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(jobs)))) as executor:
+            written = list(executor.map(self._write_inquiry_file, jobs))
+        
+        created_files = [file_path for file_path in written if file_path is not None]
         
         logger.info(f"Created {len(created_files)} files for {language}")
         return created_files
     
-    def process_bulk_files(self, file_mappings: Dict[str, str]) -> Dict[str, List[str]]:
+    def _write_inquiry_file(self, job: Tuple[Path, str]) -> Optional[str]:
+        """
+        Write one inquiry file
+        
+        Args:
+            job: (file path, inquiry content)
+            
+        Returns:
+            Path of the created file, or None if writing failed
+        """
+        file_path, content = job
+        try:
+            # Encode once and write the bytes straight to the fd (no text I/O layer);
+            # mode 0o666 is filtered by the umask, as with open()
+            data = memoryview(content.encode('utf-8'))
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            return str(file_path)
+        except Exception as e:
+            logger.error(f"Error creating file {file_path}: {str(e)}")
+            return None
+    
+    def create_manifest(self, inquiries: List[Dict[str, Any]], language: str) -> Optional[str]:
+        """
+        Write extracted inquiries to one JSON Lines manifest instead of one file each
+        
+        Each line is {"seq": ..., "lang": ..., "content": ...}; the manifest
+        is written to <sample_data_dir>/<language>.jsonl with a single write.
+        
+        Args:
+            inquiries: List of inquiry dictionaries
+            language: Language identifier
+            
+        Returns:
+            Path of the manifest, or None if writing failed
+        """
+        manifest_path = self.sample_data_dir / f"{language}.jsonl"
+        
+        lines = []
+        for inquiry in inquiries:
+            record = {'seq': inquiry['sequence'], 'lang': language, 'content': inquiry['content']}
+            if orjson is not None:
+                lines.append(orjson.dumps(record))
+            else:
+                lines.append(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        lines.append(b'')  # Trailing newline
+        
+        try:
+            manifest_path.write_bytes(b'\n'.join(lines))
+        except Exception as e:
+            logger.error(f"Error creating manifest {manifest_path}: {str(e)}")
+            return None
+        
+        logger.info(f"Created manifest with {len(inquiries)} inquiries for {language}")
+        return str(manifest_path)
+    
+    def iter_manifest(self, manifest_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the inquiries of a JSON Lines manifest
+        
+        The manifest is memory-mapped and split on newline offsets, so only
+        one record is decoded at a time.
+        
+        Args:
+            manifest_path: Path to a manifest written by create_manifest
+            
+        Returns:
+            Iterator of inquiry dictionaries (content, language, sequence)
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        
+        with open(manifest_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap cannot map an empty file
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                while start < len(mm):
+                    end = mm.find(b'\n', start)
+                    if end == -1:
+                        end = len(mm)
+                    if end > start:
+                        record = loads(mm[start:end])
+                        yield {
+                            'content': record['content'],
+                            'language': record['lang'],
+                            'sequence': record['seq']
+                        }
+                    start = end + 1
+    
+    def get_all_manifests(self) -> List[str]:
+        """
+        Get list of all inquiry manifests in the sample data directory
+        
+        Returns:
+            List of manifest paths
+        """
+        with os.scandir(self.sample_data_dir) as entries:
+            manifests = [entry.path for entry in entries if entry.name.endswith('.jsonl') and entry.is_file()]
+        
+        manifests.sort()
+        return manifests
+    
+    def process_bulk_files(self, file_mappings: Dict[str, str], use_manifest: bool = False) -> Dict[str, List[str]]:
         """
         Process all bulk files and create individual inquiry files
         
         Args:
             file_mappings: Dictionary mapping language to file path
+            use_manifest: Write one JSON Lines manifest per language (see
+                create_manifest) instead of one .txt file per inquiry
             
         Returns:
             Dictionary mapping language to list of created files
@@ -113,7 +257,11 @@ class DataProcessor:
             if os.path.exists(file_path):
                 logger.info(f"Processing {language} file: {file_path}")
                 inquiries = self.extract_inquiries_from_file(file_path, language)
-                created_files = self.create_individual_files(inquiries, language)
+                if use_manifest:
+                    manifest_path = self.create_manifest(inquiries, language)
+                    created_files = [manifest_path] if manifest_path else []
+                else:
+                    created_files = self.create_individual_files(inquiries, language)
                 all_created_files[language] = created_files
             else:
                 logger.warning(f"File not found: {file_path}")
@@ -131,10 +279,9 @@ class DataProcessor:
         Returns:
             List of file paths
         """
-        inquiry_files = []
-        
-        for file_path in self.sample_data_dir.glob("*.txt"):
-            inquiry_files.append(str(file_path))
+        # DirEntry exposes name/path directly, without building Path objects
+        with os.scandir(self.sample_data_dir) as entries:
+            inquiry_files = [entry.path for entry in entries if entry.name.endswith('.txt') and entry.is_file()]
         
         inquiry_files.sort()  # Sort for consistent processing order
         return inquiry_files
\ No newline at end of file
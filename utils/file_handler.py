@@ -3,15 +3,68 @@ File handling utilities for AI Travel Agent
 Handles file I/O operations for customer inquiries
 """
 
+import codecs
+import fnmatch
 import os
-import glob
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-import chardet
+from typing import List, Optional, Dict, Any, Iterator
+
+try:
+    import cchardet as _chardet  # optional: C port of chardet
+except ImportError:
+    import chardet as _chardet
 
 from config import Config
 from utils.logger import setup_logger
 
+# Byte order marks checked before statistical detection (UTF-32 first: its LE BOM starts with UTF-16's)
+_BOM_ENCODINGS = (
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+# Codecs (codecs.lookup names) safe to reuse across files: a strict decode rejects
+# most other encodings' bytes. Single-byte codecs decode almost anything, so a
+# sticky windows-1251 would silently garble later UTF-8 files. BOM-marked
+# UTF-16/32 never need it either, since _sniff_encoding identifies them first.
+_STICKY_CODECS = frozenset({'utf-8'})
+
+# Bytes that may appear in text files: printable, high (non-ASCII) and common whitespace/control
+_TEXT_BYTES = bytes({7, 8, 9, 10, 11, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+_MAX_CONTROL_RATIO = 0.05  # Share of other bytes above which a file is treated as binary
+
+# Extensions that are never text; their content is not sniffed by _is_text_file
+_BINARY_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.webp', '.tif', '.tiff',
+    '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar',
+    '.pdf', '.xlsx', '.xls', '.docx', '.doc', '.pptx',
+    '.exe', '.dll', '.so', '.bin', '.pyc', '.whl',
+})
+
+def _read_prefix(file_path: str, size: int) -> bytes:
+    """Read up to size leading bytes straight from the fd (no buffered file object)"""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+def _file_extension(name: str) -> str:
+    """Lower-cased extension of a bare file name, same as os.path.splitext(name)[1].lower()"""
+    dot = name.rfind('.')
+    if dot <= 0 or (name[0] == '.' and not name[:dot].lstrip('.')):
+        return ''  # no dot, or only leading dots (hidden file like .bashrc)
+    return name[dot:].lower()
+
 class FileHandler:
     """Handles file operations for customer inquiry processing"""
     
@@ -21,13 +74,27 @@ class FileHandler:
         
         # Supported text file extensions
         self.text_extensions = ['.txt', '.text', '.md', '.rtf']
+        self._text_extension_set = frozenset(self.text_extensions)
         
         # Encoding detection settings
         self.encoding_confidence_threshold = 0.7
+        self.encoding_sample_size = self.config.ENCODING_SAMPLE_SIZE
+        self.encoding_max_sample_size = self.config.ENCODING_MAX_SAMPLE_SIZE
+        self._detector_name = _chardet.__name__
+        
+        # Sticky encoding: files in one batch usually share an encoding, so a
+        # high-confidence UTF-8 detection is reused while later files still decode with it
+        self.sticky_encoding = True
+        self.sticky_confidence_threshold = 0.95
+        self._last_encoding: Optional[str] = None  # guarded by _enc_cache_lock
+        
+        # Detected encodings keyed by (path, st_mtime_ns, st_size), least recently used first
+        self._enc_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._enc_cache_lock = threading.Lock()  # files may be read from several threads
     
     def detect_encoding(self, file_path: str) -> str:
         """
-        Detect file encoding using chardet
+        Detect file encoding using cchardet (or chardet when unavailable)
         
         Args:
             file_path: Path to the file
@@ -36,23 +103,131 @@ class FileHandler:
             Detected encoding or UTF-8 as fallback
         """
         try:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read(10000)  # Read first 10KB for detection
-                
-            result = chardet.detect(raw_data)
-            
-            if result['confidence'] >= self.encoding_confidence_threshold:
-                encoding = result['encoding']
-                self.logger.debug(f"Detected encoding for {file_path}: {encoding} (confidence: {result['confidence']:.2f})")
+            stat = os.stat(file_path)
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+            encoding = self._get_cached_encoding(cache_key)
+            if encoding is not None:
                 return encoding
-            else:
-                self.logger.warning(f"Low confidence encoding detection for {file_path}, using UTF-8")
-                return 'utf-8'
+            
+            raw_data = _read_prefix(file_path, self.encoding_max_sample_size)
+            
+            encoding = self._detect_encoding_bytes(file_path, raw_data)
+            self._store_encoding(cache_key, encoding)
+            return encoding
                 
-        except Exception as e:
+        except (OSError, UnicodeError, LookupError) as e:
             self.logger.error(f"Encoding detection error for {file_path}: {str(e)}")
             return 'utf-8'
     
+    def _detect_encoding_bytes(self, file_path: str, raw_data: bytes) -> str:
+        """
+        Detect the encoding of a file from its leading bytes
+        
+        Args:
+            file_path: Path to the file (for log messages)
+            raw_data: Leading bytes of the file, up to encoding_max_sample_size
+            
+        Returns:
+            Detected encoding or UTF-8 as fallback
+        """
+        # Plain ASCII and BOM-marked text need no statistical detection
+        encoding = self._sniff_encoding(raw_data)
+        if encoding is not None:
+            return encoding
+        
+        # A prefix filling the whole sample may end mid-character
+        complete = len(raw_data) < self.encoding_max_sample_size
+        
+        with self._enc_cache_lock:
+            last_encoding = self._last_encoding
+        if last_encoding is not None:
+            if self._decodes_as(raw_data, last_encoding, final=complete):
+                return last_encoding
+            self._set_last_encoding(None)
+        
+        # Detect on a small sample first; grow it only when confidence is low
+        result = _chardet.detect(raw_data[:self.encoding_sample_size])
+        confidence = result['confidence'] or 0.0
+        if confidence < self.encoding_confidence_threshold and len(raw_data) > self.encoding_sample_size:
+            result = _chardet.detect(raw_data)
+            confidence = result['confidence'] or 0.0
+        
+        if result['encoding'] and confidence >= self.encoding_confidence_threshold:
+            encoding = result['encoding']
+            if (self.sticky_encoding and confidence >= self.sticky_confidence_threshold
+                    and self._is_sticky_codec(encoding)):
+                self._set_last_encoding(encoding)
+            self.logger.debug("Detected encoding for %s: %s (confidence: %.2f, %s)",
+                              file_path, encoding, confidence, self._detector_name)
+            return encoding
+        
+        self.logger.warning(f"Low confidence encoding detection for {file_path}, using UTF-8")
+        return 'utf-8'
+    
+    def _set_last_encoding(self, encoding: Optional[str]):
+        """Set (or with None, clear) the sticky encoding"""
+        with self._enc_cache_lock:
+            self._last_encoding = encoding
+    
+    @staticmethod
+    def _is_sticky_codec(encoding: str) -> bool:
+        """True if a strict decode in this encoding validates the bytes (see _STICKY_CODECS)"""
+        try:
+            return codecs.lookup(encoding).name in _STICKY_CODECS
+        except LookupError:
+            return False
+    
+    @staticmethod
+    def _decodes_as(raw_data: bytes, encoding: str, final: bool = True) -> bool:
+        """Check that bytes decode strictly (final=False allows a cut-off last character)"""
+        try:
+            codecs.getincrementaldecoder(encoding)('strict').decode(raw_data, final=final)
+            return True
+        except (UnicodeDecodeError, LookupError):
+            return False
+    
+    def _sniff_encoding(self, raw_data: bytes) -> Optional[str]:
+        """
+        Identify encodings that are unambiguous without statistical detection
+        
+        ASCII bytes alone are not enough: BOM-less UTF-16/32 text in the ASCII
+        range is also all bytes < 0x80, interleaved with NULs. So only
+        NUL-free ASCII is taken as UTF-8; anything with NUL goes to the detector.
+        
+        Args:
+            raw_data: Leading bytes of the file
+            
+        Returns:
+            'utf-8' for NUL-free ASCII, the BOM's encoding, or None if undecided
+        """
+        if raw_data.isascii() and b'\x00' not in raw_data:
+            return 'utf-8'
+        
+        for bom, encoding in _BOM_ENCODINGS:
+            if raw_data.startswith(bom):
+                return encoding
+        
+        return None
+    
+    def _get_cached_encoding(self, cache_key: tuple) -> Optional[str]:
+        """Return the cached encoding for (path, st_mtime_ns, st_size), if any"""
+        with self._enc_cache_lock:
+            encoding = self._enc_cache.get(cache_key)
+            if encoding is not None:
+                self._enc_cache.move_to_end(cache_key)
+            return encoding
+    
+    def _store_encoding(self, cache_key: tuple, encoding: str):
+        """Cache a detected encoding, evicting the least recently used one when full"""
+        if self.config.ENCODING_CACHE_SIZE <= 0:
+            return
+        
+        with self._enc_cache_lock:
+            self._enc_cache[cache_key] = encoding
+            self._enc_cache.move_to_end(cache_key)
+            if len(self._enc_cache) > self.config.ENCODING_CACHE_SIZE:
+                self._enc_cache.popitem(last=False)
+    
     def read_text_file(self, file_path: str) -> Optional[str]:
         """
         Read text file with automatic encoding detection
@@ -64,13 +239,20 @@ class FileHandler:
             File content as string or None if error
         """
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                self.logger.error(f"File not found: {file_path}")
-                return None
-            
+            # One open: size, mtime and content all come from the same descriptor
+            with open(file_path, 'rb') as file:
+                stat = os.fstat(file.fileno())
+                raw_data = file.read()
+        except FileNotFoundError:
+            self.logger.error(f"File not found: {file_path}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading file {file_path}: {str(e)}")
+            return None
+        
+        try:
             # Check file size
-            file_size = os.path.getsize(file_path)
+            file_size = len(raw_data)
             if file_size == 0:
                 self.logger.warning(f"Empty file: {file_path}")
                 return ""
@@ -78,35 +260,67 @@ class FileHandler:
             if file_size > self.config.MAX_TEXT_LENGTH * 2:  # Rough estimate
                 self.logger.warning(f"Large file detected: {file_path} ({file_size} bytes)")
             
-            # Detect encoding
-            encoding = self.detect_encoding(file_path)
+            # Detect encoding from the bytes already in memory
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+            encoding = self._get_cached_encoding(cache_key)
+            if encoding is None:
+                encoding = self._detect_encoding_bytes(file_path, raw_data[:self.encoding_max_sample_size])
+                self._store_encoding(cache_key, encoding)
             
-            # Read file content
-            with open(file_path, 'r', encoding=encoding, errors='replace') as file:
-                content = file.read()
+            content = self._decode_text(raw_data, encoding)
             
-            self.logger.debug(f"Successfully read file: {file_path} ({len(content)} characters)")
+            self.logger.debug("Successfully read file: %s (%d characters)", file_path, len(content))
             return content
             
-        except UnicodeDecodeError as e:
+        except (UnicodeDecodeError, LookupError) as e:
+            # Undecodable bytes, or a detected encoding Python has no codec for
             self.logger.error(f"Unicode decode error for {file_path}: {str(e)}")
+            self._set_last_encoding(None)  # re-detect for the next file
             # Try with different encodings
             for fallback_encoding in ['utf-8', 'latin-1', 'cp1252']:
                 try:
-                    with open(file_path, 'r', encoding=fallback_encoding, errors='replace') as file:
-                        content = file.read()
+                    content = self._decode_text(raw_data, fallback_encoding)
                     self.logger.warning(f"Successfully read {file_path} with fallback encoding: {fallback_encoding}")
                     return content
-                except:
+                except UnicodeError:
                     continue
             
             self.logger.error(f"Failed to read {file_path} with any encoding")
             return None
             
         except Exception as e:
+            # Contract: callers get None for any unreadable file, never an exception
             self.logger.error(f"Error reading file {file_path}: {str(e)}")
             return None
     
+    def read_text_files(self, paths: List[str], max_workers: int = 16) -> Dict[str, Optional[str]]:
+        """
+        Read several text files concurrently
+        
+        Args:
+            paths: Paths of the text files
+            max_workers: Maximum number of reader threads
+            
+        Returns:
+            Dictionary mapping each path to its content (None if unreadable)
+        """
+        if not paths:
+            return {}
+        
+        # File reads release the GIL, so reads overlap across threads
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            contents = list(executor.map(self.read_text_file, paths))
+        
+        return dict(zip(paths, contents))
+    
+    @staticmethod
+    def _decode_text(raw_data: bytes, encoding: str) -> str:
+        """Decode file bytes like text-mode open(): replace bad bytes, translate newlines"""
+        content = raw_data.decode(encoding, errors='replace')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def get_text_files(self, directory: str) -> List[str]:
         """
         Get all text files from a directory
@@ -128,18 +342,19 @@ class FileHandler:
                 self.logger.error(f"Path is not a directory: {directory}")
                 return text_files
             
-            # Search for text files
-            for extension in self.text_extensions:
-                pattern = os.path.join(directory, f"*{extension}")
-                files = glob.glob(pattern)
-                text_files.extend(files)
-            
-            # Also include files without extension that might be text
-            for file_path in glob.glob(os.path.join(directory, "*")):
-                if os.path.isfile(file_path) and not os.path.splitext(file_path)[1]:
-                    # Check if it's a text file by trying to read it
-                    if self._is_text_file(file_path):
-                        text_files.append(file_path)
+            # Single directory pass; DirEntry caches the file type from the listing
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.') or not entry.is_file():
+                        continue  # glob-style: skip hidden files and non-files
+                    
+                    extension = _file_extension(name)
+                    if extension in self._text_extension_set:
+                        text_files.append(entry.path)
+                    elif not extension and self._is_text_file(entry.path):
+                        # Files without extension are included if their content looks like text
+                        text_files.append(entry.path)
             
             # Sort files for consistent processing order
             text_files.sort()
@@ -162,25 +377,18 @@ class FileHandler:
             True if file appears to be text, False otherwise
         """
         try:
-            with open(file_path, 'rb') as file:
-                chunk = file.read(1024)  # Read first 1KB
+            chunk = _read_prefix(file_path, 1024)  # Read first 1KB
             
             # Check for null bytes (binary files usually contain them)
             if b'\x00' in chunk:
                 return False
             
-            # Try to decode as text
-            try:
-                chunk.decode('utf-8')
-                return True
-            except UnicodeDecodeError:
-                try:
-                    chunk.decode('latin-1')
-                    return True
-                except UnicodeDecodeError:
-                    return False
+            # Latin-1 decodes any bytes, so judge by control characters instead:
+            # text has almost none outside tab, newline, carriage return, etc.
+            control_count = len(chunk.translate(None, _TEXT_BYTES))
+            return control_count <= len(chunk) * _MAX_CONTROL_RATIO
                     
-        except Exception:
+        except OSError:
             return False
     
     def write_text_file(self, file_path: str, content: str, encoding: str = 'utf-8') -> bool:
@@ -199,11 +407,16 @@ class FileHandler:
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            # Write file
-            with open(file_path, 'w', encoding=encoding) as file:
-                file.write(content)
+            # Encode once and hand the bytes to a single binary write; newlines are
+            # translated as text mode would (a no-op where os.linesep is '\n')
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            data = content.encode(encoding)
+            
+            with open(file_path, 'wb') as file:
+                file.write(data)
             
-            self.logger.debug(f"Successfully wrote file: {file_path}")
+            self.logger.debug("Successfully wrote file: %s", file_path)
             return True
             
         except Exception as e:
@@ -238,7 +451,7 @@ class FileHandler:
                 'dirname': os.path.dirname(file_path)
             }
             
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"Error getting file info for {file_path}: {str(e)}")
             return {'exists': False, 'error': str(e)}
     
@@ -288,7 +501,7 @@ class FileHandler:
         
         Args:
             directory: Directory to clean
-            pattern: File pattern to match (default: *.tmp)
+            pattern: File name pattern to match (default: *.tmp)
             
         Returns:
             Number of files deleted
@@ -299,15 +512,23 @@ class FileHandler:
             if not os.path.exists(directory):
                 return deleted_count
             
-            temp_files = glob.glob(os.path.join(directory, pattern))
+            # Match names while listing the directory; like glob, hidden files
+            # only match patterns that themselves start with '.'
+            match = re.compile(fnmatch.translate(pattern)).match
+            include_hidden = pattern.startswith('.')
             
-            for temp_file in temp_files:
-                try:
-                    os.remove(temp_file)
-                    deleted_count += 1
-                    self.logger.debug(f"Deleted temp file: {temp_file}")
-                except Exception as e:
-                    self.logger.warning(f"Could not delete temp file {temp_file}: {str(e)}")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith('.') and not include_hidden) or not match(name) or entry.is_dir():
+                        continue
+                    
+                    try:
+                        os.remove(entry.path)
+                        deleted_count += 1
+                        self.logger.debug("Deleted temp file: %s", entry.path)
+                    except Exception as e:
+                        self.logger.warning(f"Could not delete temp file {entry.path}: {str(e)}")
             
             if deleted_count > 0:
                 self.logger.info(f"Cleaned up {deleted_count} temporary files from {directory}")
@@ -340,42 +561,75 @@ class FileHandler:
             if not os.path.exists(directory):
                 return stats
             
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
+            for entry in self._iter_file_entries(directory):
+                file = entry.name
+                
+                try:
+                    file_size = entry.stat().st_size
+                    extension = _file_extension(file)
                     
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        extension = os.path.splitext(file)[1].lower()
-                        
-                        stats['total_files'] += 1
-                        stats['total_size'] += file_size
-                        
-                        # Count extensions
-                        stats['extensions'][extension] = stats['extensions'].get(extension, 0) + 1
-                        
-                        # Check if it's a text file
-                        if extension in self.text_extensions or self._is_text_file(file_path):
-                            stats['text_files'] += 1
-                        
-                        # Track largest file
-                        if file_size > stats['largest_file']['size']:
-                            stats['largest_file'] = {'name': file, 'size': file_size}
+                    stats['total_files'] += 1
+                    stats['total_size'] += file_size
+                    
+                    # Count extensions
+                    stats['extensions'][extension] = stats['extensions'].get(extension, 0) + 1
+                    
+                    # Check if it's a text file (known binary types are not opened)
+                    if extension in self._text_extension_set or (
+                            extension not in _BINARY_EXTENSIONS and self._is_text_file(entry.path)):
+                        stats['text_files'] += 1
+                    
+                    # Track largest file
+                    if file_size > stats['largest_file']['size']:
+                        stats['largest_file'] = {'name': file, 'size': file_size}
+                    
+                    # Track smallest file
+                    if file_size < stats['smallest_file']['size']:
+                        stats['smallest_file'] = {'name': file, 'size': file_size}
                         
-                        # Track smallest file
-                        if file_size < stats['smallest_file']['size']:
-                            stats['smallest_file'] = {'name': file, 'size': file_size}
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Could not stat file {file_path}: {str(e)}")
+                except OSError as e:
+                    self.logger.warning(f"Could not stat file {entry.path}: {str(e)}")
             
             # Clean up smallest file if no files found
             if stats['smallest_file']['size'] == float('inf'):
                 stats['smallest_file'] = {'name': '', 'size': 0}
             
-            self.logger.debug(f"Directory stats for {directory}: {stats}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Directory stats for {directory}: {stats}")
             
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"Error getting directory stats for {directory}: {str(e)}")
         
         return stats
+    
+    def _iter_file_entries(self, directory: str) -> Iterator[os.DirEntry]:
+        """
+        Walk a directory tree top-down, yielding the DirEntry of every non-directory
+        
+        Same traversal as os.walk: symlinked directories are not followed and
+        unreadable subdirectories are skipped.
+        
+        Args:
+            directory: Root directory to walk
+            
+        Returns:
+            Iterator over DirEntry objects (stat results are cached per entry)
+        """
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if not is_dir:
+                    yield entry
+                elif not entry.is_symlink():
+                    subdirectories.append(entry.path)
+        
+        for subdirectory in subdirectories:
+            try:
+                yield from self._iter_file_entries(subdirectory)
+            except OSError as e:
+                self.logger.warning(f"Could not read directory {subdirectory}: {str(e)}")
@@ -4,17 +4,26 @@ Provides centralized logging configuration
 """
 
 import os
+import functools
 import logging
 import logging.handlers
-from datetime import datetime
+import time
 from pathlib import Path
 
 from config import Config
 
+# Built once at import and shared by every logger
+_CONFIG = Config()
+_FORMATTER = logging.Formatter(_CONFIG.LOG_FORMAT)
+_LOG_LEVEL = getattr(logging, _CONFIG.LOG_LEVEL, logging.INFO)
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str, level: str = None) -> logging.Logger:
     """
     Setup logger with file and console handlers
     
+    Results are cached per (name, level), so repeated calls skip Config() and handler checks.
+    
     Args:
         name: Logger name
         level: Log level (optional, uses config default)
@@ -22,8 +31,6 @@ def setup_logger(name: str, level: str = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    config = Config()
-    
     # Create logger
     logger = logging.getLogger(name)
     
@@ -32,31 +39,28 @@ def setup_logger(name: str, level: str = None) -> logging.Logger:
         return logger
     
     # Set log level
-    log_level = getattr(logging, level or config.LOG_LEVEL, logging.INFO)
+    log_level = getattr(logging, level, logging.INFO) if level else _LOG_LEVEL
     logger.setLevel(log_level)
     
-    # Create formatter
-    formatter = logging.Formatter(config.LOG_FORMAT)
-    
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
     # File handler
     try:
         # Ensure logs directory exists
-        os.makedirs(config.LOGS_DIR, exist_ok=True)
+        os.makedirs(_CONFIG.LOGS_DIR, exist_ok=True)
         
         # Create rotating file handler
         file_handler = logging.handlers.RotatingFileHandler(
-            config.LOG_FILE,
+            _CONFIG.LOG_FILE,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
         )
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
         
     except Exception as e:
@@ -96,33 +100,45 @@ def log_execution_time(func):
     Returns:
         Decorated function
     """
+    logger = None  # set up on the first call, then reused
+    
     def wrapper(*args, **kwargs):
-        logger = setup_logger(f"{func.__module__}.{func.__name__}")
-        start_time = datetime.now()
+        nonlocal logger
+        if logger is None:
+            logger = setup_logger(f"{func.__module__}.{func.__name__}")
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Function {func.__name__} executed in {execution_time:.3f} seconds")
+            execution_time = time.perf_counter() - start_time
+            logger.debug("Function %s executed in %.3f seconds", func.__name__, execution_time)
             return result
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Function {func.__name__} failed after {execution_time:.3f} seconds: {str(e)}")
             raise
     
     return wrapper
 
+# psutil Process handle for log_memory_usage: None until first use, False if psutil is missing
+_process = None
+
 def log_memory_usage():
     """Log current memory usage"""
-    try:
-        import psutil
-        process = psutil.Process()
-        memory_info = process.memory_info()
+    global _process
+    if _process is None or (_process and _process.pid != os.getpid()):
+        # (Re)create after fork too: a Process handle is bound to one pid
+        try:
+            import psutil
+            _process = psutil.Process()
+        except ImportError:
+            _process = False  # psutil not available
+    
+    if _process:
+        memory_info = _process.memory_info()
         logger = setup_logger('memory_monitor')
-        logger.debug(f"Memory usage: {memory_info.rss / 1024 / 1024:.2f} MB")
-    except ImportError:
-        pass  # psutil not available
+        logger.debug("Memory usage: %.2f MB", memory_info.rss / 1024 / 1024)
 
 def setup_error_handler():
     """Setup global error handler for uncaught exceptions"""